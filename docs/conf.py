@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -20,9 +21,13 @@ extensions = [
     "sphinx.ext.autosummary",
     "sphinx.ext.viewcode",
     "sphinx.ext.napoleon",
-    "sphinx_autodoc_typehints",
 ]
 
+# sphinx_autodoc_typehints is a nice-to-have that slows setup and is only in
+# the optional docs dependency group; enable it only when it is installed.
+if importlib.util.find_spec("sphinx_autodoc_typehints") is not None:
+    extensions.append("sphinx_autodoc_typehints")
+
 templates_path = ["_templates"]
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
@@ -31,6 +36,17 @@ html_theme = "sphinx_rtd_theme"
 html_static_path = ["_static"]
 
 # Autodoc options
+#
+# Mock the Sudachi binding so building the docs never imports the native
+# module or its dictionaries; autodoc only needs the Python-side signatures
+# and docstrings.
+autodoc_mock_imports = [
+    "sudachipy",
+    "sudachidict_full",
+    "sudachidict_core",
+    "sudachidict_small",
+]
+
 autodoc_default_options = {
     "members": True,
     "member-order": "bysource",
@@ -1,5 +1,45 @@
-"""txt-to-anki: A CLI tool for converting plain text files into Anki deck formats."""
+"""txt-to-anki: A CLI tool for converting plain text files into Anki deck formats.
+
+The tokenizer API is re-exported here for convenience but resolved lazily
+(PEP 562), so importing txt_to_anki keeps the near-zero startup cost the CLI
+entry point relies on.
+"""
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 __version__ = "0.1.0"
+
+__all__ = [
+    "__version__",
+    "JapaneseTokenizer",
+    "Token",
+    "TokenizationMode",
+]
+
+# Convenience re-exports resolved on first access so that importing the top
+# package stays free of tokenizer (and transitively sudachipy) import cost.
+_LAZY_ATTRIBUTES = {
+    "JapaneseTokenizer": "txt_to_anki.tokenizer",
+    "Token": "txt_to_anki.tokenizer",
+    "TokenizationMode": "txt_to_anki.tokenizer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily-imported attributes on first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily-imported attributes in dir() output."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,46 +1,34 @@
-"""Main CLI interface for txt-to-anki.
+"""Thin CLI entry point for txt-to-anki.
 
-This module provides the command-line interface for the txt-to-anki tool.
-It uses Typer to create a user-friendly CLI that converts plain text files
-into Anki deck formats for spaced repetition learning.
-
-The main entry point is the `convert` command, which handles the conversion
-process from text input to Anki-compatible output format.
+This module keeps process startup fast by deferring the import of Typer (and
+everything it pulls in, such as click and rich) until the command is actually
+dispatched. The Typer application itself lives in :mod:`txt_to_anki.cli_app`.
 """
 
 from __future__ import annotations
 
-import typer
-
-app = typer.Typer(
-    name="txt-to-anki",
-    help="Convert plain text files into Anki deck formats for spaced repetition learning.",
-)
+from typing import Any
 
 
-@app.command()
-def convert() -> None:
-    """Convert a text file to Anki deck format.
+def main() -> None:
+    """Run the txt-to-anki command-line application.
 
-    This is the main command for converting plain text files into Anki deck formats
-    suitable for spaced repetition learning. The conversion process extracts content
-    from the input and formats it appropriately for Anki.
+    Imports the Typer application lazily so that the interpreter does not pay
+    the typer/click import cost until dispatch time.
+    """
+    from txt_to_anki.cli_app import app
 
-    Examples:
-        Basic usage:
+    app()
 
-        .. code-block:: bash
 
-            txt-to-anki
+def __getattr__(name: str) -> Any:
+    """Resolve the Typer ``app`` lazily for callers that import it directly."""
+    if name == "app":
+        from txt_to_anki.cli_app import app
 
-    Note:
-        This is currently a placeholder implementation. The actual conversion
-        logic will be implemented in future versions.
-    """
-    typer.echo("Converting text to Anki deck format...")
-    # TODO: Implement actual conversion logic
-    typer.echo("Conversion complete!")
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -0,0 +1,48 @@
+"""Main CLI interface for txt-to-anki.
+
+This module provides the command-line interface for the txt-to-anki tool.
+It uses Typer to create a user-friendly CLI that converts plain text files
+into Anki deck formats for spaced repetition learning.
+
+The main entry point is the `convert` command, which handles the conversion
+process from text input to Anki-compatible output format. The console script
+dispatches through :func:`txt_to_anki.cli.main`, which imports this module
+lazily to keep CLI startup fast.
+"""
+
+from __future__ import annotations
+
+import typer
+
+app = typer.Typer(
+    name="txt-to-anki",
+    help="Convert plain text files into Anki deck formats for spaced repetition learning.",
+)
+
+
+@app.command()
+def convert() -> None:
+    """Convert a text file to Anki deck format.
+
+    This is the main command for converting plain text files into Anki deck formats
+    suitable for spaced repetition learning. The conversion process extracts content
+    from the input and formats it appropriately for Anki.
+
+    Examples:
+        Basic usage:
+
+        .. code-block:: bash
+
+            txt-to-anki
+
+    Note:
+        This is currently a placeholder implementation. The actual conversion
+        logic will be implemented in future versions.
+    """
+    typer.echo("Converting text to Anki deck format...")
+    # TODO: Implement actual conversion logic
+    typer.echo("Conversion complete!")
+
+
+if __name__ == "__main__":
+    app()
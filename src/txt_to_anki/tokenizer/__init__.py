@@ -3,23 +3,58 @@
 This module provides Japanese text tokenization capabilities using the Sudachi
 morphological analyzer. It extracts individual words (tokens) from Japanese text
 with comprehensive linguistic metadata.
+
+The heavyweight Sudachi-backed classes (``JapaneseTokenizer`` and
+``TokenizationMode``) are imported lazily on first attribute access so that
+importing this package does not pay the sudachipy import cost. Lightweight
+pieces (``Token`` and the exception hierarchy) are imported eagerly.
 """
 
 from __future__ import annotations
 
-from txt_to_anki.tokenizer.token_models import Token
-from txt_to_anki.tokenizer.japanese_tokenizer import JapaneseTokenizer, TokenizationMode
+import importlib
+from typing import Any
+
 from txt_to_anki.tokenizer.exceptions import (
     FileProcessingError,
     TokenizationError,
     TokenizerInitializationError,
 )
+from txt_to_anki.tokenizer.token_models import Token, TokenColumns
 
 __all__ = [
     "Token",
+    "TokenColumns",
     "JapaneseTokenizer",
     "TokenizationMode",
+    "is_japanese_text",
     "FileProcessingError",
     "TokenizationError",
     "TokenizerInitializationError",
 ]
+
+# Attributes resolved lazily (PEP 562) to avoid importing sudachipy until a
+# caller actually needs the tokenizer.
+_LAZY_ATTRIBUTES = {
+    "JapaneseTokenizer": "txt_to_anki.tokenizer.japanese_tokenizer",
+    "TokenizationMode": "txt_to_anki.tokenizer.japanese_tokenizer",
+    "is_japanese_text": "txt_to_anki.tokenizer.japanese_tokenizer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily-imported attributes on first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = getattr(module, name)
+    # Cache on the package so subsequent lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily-imported attributes in dir() output."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
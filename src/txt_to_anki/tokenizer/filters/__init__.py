@@ -0,0 +1,26 @@
+"""Token filtering system for tokenizer output.
+
+This package provides composable filters for post-processing tokenizer
+output, such as removing particles before building Anki decks. Filters
+implement the :class:`TokenFilter` protocol.
+"""
+
+from __future__ import annotations
+
+from txt_to_anki.tokenizer.filters.pos_filters import (
+    FUNCTION_WORD_POS,
+    NON_CONTENT_POS,
+    ParticleFilter,
+    POSFilter,
+    PunctuationFilter,
+)
+from txt_to_anki.tokenizer.filters.protocol import TokenFilter
+
+__all__ = [
+    "TokenFilter",
+    "ParticleFilter",
+    "POSFilter",
+    "PunctuationFilter",
+    "FUNCTION_WORD_POS",
+    "NON_CONTENT_POS",
+]
@@ -0,0 +1,155 @@
+"""Part-of-speech based token filters.
+
+This module provides filters that drop tokens based on their Sudachi
+part-of-speech tags, such as particles that carry no vocabulary value for
+Anki decks.
+
+The POS tag constants are hoisted to module level and interned so the hot
+per-token comparison in ``filter`` is a single pointer-or-equality check
+against a shared string object rather than a fresh literal per call.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+
+from txt_to_anki.tokenizer.token_models import Token
+
+# Sudachi POS tag for particles (は, が, を, ...). Interned so comparisons
+# against interned token tags short-circuit on identity.
+_PARTICLE_POS = sys.intern("助詞")
+
+# Sudachi POS tags for punctuation: 補助記号 covers 。、！？ etc., 記号 covers
+# standalone symbols. A single frozenset keeps the hot check to one membership
+# test instead of chained comparisons.
+_PUNCTUATION_POS = frozenset({sys.intern("補助記号"), sys.intern("記号")})
+
+# Ready-made exclusion sets for vocabulary extraction, suitable for
+# POSFilter(exclude=...). Built (and interned) once at import instead of as a
+# fresh set literal at each call site.
+FUNCTION_WORD_POS = frozenset({_PARTICLE_POS, sys.intern("助動詞")})
+NON_CONTENT_POS = FUNCTION_WORD_POS | _PUNCTUATION_POS
+
+
+class ParticleFilter:
+    """Removes particle tokens (助詞) from tokenizer output.
+
+    Particles are grammatical function words that are rarely useful as
+    standalone vocabulary cards.
+
+    Example:
+        >>> tokenizer = JapaneseTokenizer()
+        >>> tokens = tokenizer.tokenize_text("私は日本語を勉強します。")
+        >>> content = ParticleFilter().filter(tokens)
+        >>> all(t.part_of_speech != "助詞" for t in content)
+        True
+    """
+
+    def keep(self, token: Token) -> bool:
+        """Return True if the token is not a particle.
+
+        Args:
+            token: Token to evaluate
+
+        Returns:
+            True if the token should be kept
+        """
+        return token.part_of_speech != _PARTICLE_POS
+
+    def filter(self, tokens: list[Token]) -> list[Token]:
+        """Remove particle tokens from the list.
+
+        Args:
+            tokens: Tokens to filter
+
+        Returns:
+            Tokens whose part of speech is not 助詞
+        """
+        return [token for token in tokens if token.part_of_speech != _PARTICLE_POS]
+
+
+class POSFilter:
+    """Removes tokens whose part of speech is in a caller-supplied set.
+
+    Generalizes ParticleFilter/PunctuationFilter to arbitrary POS tags. The
+    excluded tags are frozen and interned at construction so each per-token
+    check is a single hash lookup against shared string objects.
+
+    Example:
+        >>> tokenizer = JapaneseTokenizer()
+        >>> tokens = tokenizer.tokenize_text("私は日本語を勉強します。")
+        >>> content = POSFilter(exclude={"助詞", "助動詞"}).filter(tokens)
+        >>> any(t.part_of_speech == "助詞" for t in content)
+        False
+    """
+
+    def __init__(self, exclude: Iterable[str]) -> None:
+        """Initialize the filter with POS tags to exclude.
+
+        Args:
+            exclude: Sudachi POS tags to drop (e.g. {"助詞", "助動詞"})
+        """
+        self.exclude = frozenset(sys.intern(tag) for tag in exclude)
+
+    def keep(self, token: Token) -> bool:
+        """Return True if the token's part of speech is not excluded.
+
+        Args:
+            token: Token to evaluate
+
+        Returns:
+            True if the token should be kept
+        """
+        return token.part_of_speech not in self.exclude
+
+    def filter(self, tokens: list[Token]) -> list[Token]:
+        """Remove tokens with excluded POS tags from the list.
+
+        Args:
+            tokens: Tokens to filter
+
+        Returns:
+            Tokens whose part of speech is not in the excluded set
+        """
+        exclude = self.exclude
+        return [token for token in tokens if token.part_of_speech not in exclude]
+
+
+class PunctuationFilter:
+    """Removes punctuation and symbol tokens from tokenizer output.
+
+    Drops tokens tagged 補助記号 (sentence punctuation such as 。 and ？) or
+    記号 (standalone symbols), neither of which makes a useful Anki card.
+
+    Example:
+        >>> tokenizer = JapaneseTokenizer()
+        >>> tokens = tokenizer.tokenize_text("元気ですか？")
+        >>> words = PunctuationFilter().filter(tokens)
+        >>> "？" in [t.surface for t in words]
+        False
+    """
+
+    def keep(self, token: Token) -> bool:
+        """Return True if the token is not punctuation or a symbol.
+
+        Args:
+            token: Token to evaluate
+
+        Returns:
+            True if the token should be kept
+        """
+        return token.part_of_speech not in _PUNCTUATION_POS
+
+    def filter(self, tokens: list[Token]) -> list[Token]:
+        """Remove punctuation and symbol tokens from the list.
+
+        Args:
+            tokens: Tokens to filter
+
+        Returns:
+            Tokens whose part of speech is not a punctuation tag
+        """
+        return [
+            token for token in tokens if token.part_of_speech not in _PUNCTUATION_POS
+        ]
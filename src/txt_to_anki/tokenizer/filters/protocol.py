@@ -0,0 +1,33 @@
+"""Protocol definition for token filters.
+
+This module defines the TokenFilter protocol that all filter implementations
+must satisfy. Filters transform a list of tokens into a (usually smaller)
+list of tokens, enabling composable post-processing of tokenizer output.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol, runtime_checkable
+
+from txt_to_anki.tokenizer.token_models import Token
+
+
+@runtime_checkable
+class TokenFilter(Protocol):
+    """Protocol for token filtering implementations.
+
+    Implementations decide which tokens to keep. Filters that evaluate each
+    token independently should also provide a ``keep`` predicate so that
+    filter chains can be fused into a single pass over the token list.
+    """
+
+    def filter(self, tokens: list[Token]) -> list[Token]:
+        """Filter tokens based on specific criteria.
+
+        Args:
+            tokens: Tokens to filter
+
+        Returns:
+            The tokens that pass the filter's criteria
+        """
+        ...
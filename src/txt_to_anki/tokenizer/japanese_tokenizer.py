@@ -6,9 +6,18 @@ for morphological analysis and token extraction from Japanese text.
 
 from __future__ import annotations
 
+import io
+import os
 import re
+import stat
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from typing import Any
 
 from sudachipy import Dictionary  # type: ignore[import-untyped]
 from sudachipy.tokenizer import Tokenizer as SudachiTokenizer  # type: ignore[import-untyped]
@@ -18,7 +27,176 @@ from txt_to_anki.tokenizer.exceptions import (
     TokenizationError,
     TokenizerInitializationError,
 )
-from txt_to_anki.tokenizer.token_models import Token
+from txt_to_anki.tokenizer.filters.protocol import TokenFilter
+from txt_to_anki.tokenizer.token_models import Token, TokenColumns
+
+# Number of distinct input strings memoized per tokenizer instance. Sized for
+# line- or sentence-level inputs with many repeats (song lyrics, subtitles),
+# not for whole-file blobs.
+_TOKENIZE_CACHE_SIZE = 1024
+
+# Inputs longer than this many characters are split into line-aligned chunks
+# before being handed to Sudachi. Sudachi's lattice cost grows superlinearly
+# with input length (and it rejects very large inputs outright), so keeping
+# chunks bounded caps per-call latency and peak memory.
+_CHUNK_SIZE = 8192
+
+# Byte values considered "text" when sniffing for binary files: common
+# control characters plus everything from space upward.
+_TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)))
+
+
+# Tokenizer built once per worker process by tokenize_files
+_worker_tokenizer: JapaneseTokenizer | None = None
+
+
+def _init_worker_tokenizer(
+    mode: TokenizationMode, dictionary_type: str, require_japanese: bool
+) -> None:
+    """Initialize the per-process tokenizer for tokenize_files workers."""
+    global _worker_tokenizer
+    _worker_tokenizer = JapaneseTokenizer(
+        mode=mode,
+        dictionary_type=dictionary_type,
+        require_japanese=require_japanese,
+    )
+
+
+def _tokenize_file_in_worker(file_path: Path, partial_ok: bool) -> list[Token]:
+    """Tokenize one file with the worker process's tokenizer."""
+    assert _worker_tokenizer is not None  # set by _init_worker_tokenizer
+    return _worker_tokenizer.tokenize_file(file_path, partial_ok=partial_ok)
+
+
+# Loaded Sudachi dictionaries, keyed by dictionary type ("full", "core",
+# "small"). Loading a dictionary takes hundreds of milliseconds and tens to
+# hundreds of MB, so every JapaneseTokenizer instance shares one Dictionary
+# per type; each instance still creates its own (cheap) tokenizer handle.
+_DICTIONARY_CACHE: dict[str, Dictionary] = {}
+
+
+def _load_dictionary(dictionary_type: str) -> Dictionary:
+    """Return the shared Dictionary for the given type, loading it once.
+
+    Args:
+        dictionary_type: Sudachi dictionary type - "full", "core", or "small"
+
+    Returns:
+        The cached Dictionary instance
+
+    Raises:
+        ModuleNotFoundError: If the dictionary package is not installed
+    """
+    dictionary = _DICTIONARY_CACHE.get(dictionary_type)
+    if dictionary is None:
+        dictionary = Dictionary(dict=dictionary_type)
+        _DICTIONARY_CACHE[dictionary_type] = dictionary
+    return dictionary
+
+
+# Japanese character ranges for validation: hiragana + katakana (contiguous,
+# U+3040-U+30FF) and CJK unified ideographs. A single character class with no
+# group or repetition lets the regex engine stop at the first Japanese
+# character instead of matching a full run.
+_JAPANESE_PATTERN = re.compile("[぀-ヿ一-鿿]")
+_JAPANESE_SEARCH = _JAPANESE_PATTERN.search
+
+
+def is_japanese_text(text: str) -> bool:
+    """Check whether text contains any Japanese characters.
+
+    Pure function over the string (no tokenizer or dictionary involved), so
+    callers can screen inputs without constructing a JapaneseTokenizer.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        True if text contains hiragana, katakana, or kanji characters
+    """
+    # Pure-ASCII input (the common negative case: English text, file paths,
+    # markup) cannot contain Japanese; str.isascii is a single C-level flag
+    # check, far cheaper than running the regex engine to exhaustion.
+    if text.isascii():
+        return False
+    return _JAPANESE_SEARCH(text) is not None
+
+
+# Sentence-sized pieces of a line: a run up to and including a Japanese
+# sentence ender, or a trailing run without one. Used to split oversized
+# single lines without cutting mid-sentence.
+_SENTENCE_PATTERN = re.compile("[^。！？]*[。！？]+|[^。！？]+")
+
+
+def _iter_sentence_chunks(
+    line: str, start: int, max_chars: int
+) -> Iterable[tuple[int, str]]:
+    """Split one oversized line into chunks aligned to sentence enders.
+
+    Sentences are accumulated until the next one would exceed max_chars. A
+    single sentence longer than max_chars is emitted as its own oversized
+    chunk rather than split mid-sentence.
+
+    Args:
+        line: The line to split
+        start: The line's character offset in the original text
+        max_chars: Target maximum chunk length in characters
+
+    Yields:
+        (offset, chunk) pairs where offset is the chunk's character offset in
+        the original text
+    """
+    chunk_start = 0
+    chunk_end = 0
+    for match in _SENTENCE_PATTERN.finditer(line):
+        sentence_end = match.end()
+        if chunk_end > chunk_start and sentence_end - chunk_start > max_chars:
+            yield start + chunk_start, line[chunk_start:chunk_end]
+            chunk_start = match.start()
+        chunk_end = sentence_end
+    if chunk_end > chunk_start:
+        yield start + chunk_start, line[chunk_start:chunk_end]
+
+
+def _iter_line_chunks(
+    text: str, max_chars: int = _CHUNK_SIZE
+) -> Iterable[tuple[int, str]]:
+    """Split text into chunks of at most max_chars, aligned to line breaks.
+
+    Lines are accumulated until the next line would exceed max_chars. A single
+    line longer than max_chars is further split on sentence boundaries (。！？)
+    so Sudachi never sees one huge lattice for unbroken prose.
+
+    Args:
+        text: Text to split
+        max_chars: Target maximum chunk length in characters
+
+    Yields:
+        (offset, chunk) pairs where offset is the chunk's character offset in
+        the original text
+    """
+    chunk_start = 0
+    chunk_end = 0
+    position = 0
+    for line in text.splitlines(keepends=True):
+        line_end = position + len(line)
+        if len(line) > max_chars:
+            # Flush the pending chunk, then break the oversized line at
+            # sentence enders instead of emitting it whole.
+            if chunk_end > chunk_start:
+                yield chunk_start, text[chunk_start:chunk_end]
+            yield from _iter_sentence_chunks(line, position, max_chars)
+            chunk_start = line_end
+            chunk_end = line_end
+            position = line_end
+            continue
+        if chunk_end > chunk_start and line_end - chunk_start > max_chars:
+            yield chunk_start, text[chunk_start:chunk_end]
+            chunk_start = position
+        chunk_end = line_end
+        position = line_end
+    if chunk_end > chunk_start:
+        yield chunk_start, text[chunk_start:chunk_end]
 
 
 class TokenizationMode(Enum):
@@ -128,13 +306,12 @@ class JapaneseTokenizer:
             {'食べる'}
     """
 
-    # Japanese character ranges for validation
-    _HIRAGANA_RANGE = r"[\u3040-\u309F]"
-    _KATAKANA_RANGE = r"[\u30A0-\u30FF]"
-    _KANJI_RANGE = r"[\u4E00-\u9FFF]"
-    _JAPANESE_PATTERN = re.compile(
-        f"({_HIRAGANA_RANGE}|{_KATAKANA_RANGE}|{_KANJI_RANGE})+"
-    )
+    # Map our enum to Sudachi's SplitMode, built once at class definition
+    _SPLIT_MODES = {
+        TokenizationMode.SHORT: SudachiTokenizer.SplitMode.A,
+        TokenizationMode.MEDIUM: SudachiTokenizer.SplitMode.B,
+        TokenizationMode.LONG: SudachiTokenizer.SplitMode.C,
+    }
 
     def __init__(
         self,
@@ -156,7 +333,89 @@ class JapaneseTokenizer:
         self.dictionary_type = dictionary_type
         self.require_japanese = require_japanese
         self._tokenizer: SudachiTokenizer | None = None
+        self._filters: list[TokenFilter] = []
         self._initialize_sudachi()
+        # Per-instance memoization of tokenization results. Bound here (not
+        # decorating the method) so the cache dies with the instance instead
+        # of keeping it alive globally.
+        self._tokenize_cached = lru_cache(maxsize=_TOKENIZE_CACHE_SIZE)(
+            self._tokenize_uncached
+        )
+
+    def add_filter(self, filter_impl: TokenFilter) -> None:
+        """Add a filter to the end of the filter chain.
+
+        Args:
+            filter_impl: Filter to apply to tokenizer output
+        """
+        self._filters.append(filter_impl)
+
+    def set_filters(self, filters: list[TokenFilter]) -> None:
+        """Replace the filter chain with the given filters.
+
+        The tokenizer takes ownership of a passed-in list rather than
+        copying it; callers should not mutate it afterwards. Other iterables
+        are materialized into a fresh list.
+
+        Args:
+            filters: Filters to apply, in order
+        """
+        self._filters = filters if isinstance(filters, list) else list(filters)
+
+    def apply_filters(self, tokens: list[Token]) -> list[Token]:
+        """Apply the configured filter chain to a list of tokens.
+
+        Consecutive filters that expose a per-token ``keep`` predicate are
+        fused into a single pass over the token list, avoiding one
+        intermediate list per filter. Filters without a predicate fall back
+        to their ``filter`` method.
+
+        Args:
+            tokens: Tokens to filter
+
+        Returns:
+            Tokens that pass every filter in the chain
+        """
+        # Nothing to filter (the common case for callers without a chain):
+        # skip the dispatch machinery entirely.
+        if not self._filters or not tokens:
+            return tokens
+
+        # Hoist the chain into a local so the loops below hit LOAD_FAST
+        # instead of an attribute lookup per filter.
+        filters = self._filters
+        index = 0
+        filter_count = len(filters)
+        while index < filter_count:
+            current = filters[index]
+            keep = getattr(current, "keep", None)
+            if keep is None:
+                tokens = current.filter(tokens)
+                index += 1
+                continue
+
+            # Collect the run of predicate-based filters starting here and
+            # apply them in one pass.
+            predicates = [keep]
+            index += 1
+            while index < filter_count:
+                next_keep = getattr(filters[index], "keep", None)
+                if next_keep is None:
+                    break
+                predicates.append(next_keep)
+                index += 1
+
+            if len(predicates) == 1:
+                predicate = predicates[0]
+                tokens = [token for token in tokens if predicate(token)]
+            else:
+                tokens = [
+                    token
+                    for token in tokens
+                    if all(predicate(token) for predicate in predicates)
+                ]
+
+        return tokens
 
     def _initialize_sudachi(self) -> None:
         """Initialize the Sudachi tokenizer.
@@ -165,88 +424,129 @@ class JapaneseTokenizer:
             TokenizerInitializationError: If Sudachi initialization fails
         """
         try:
-            # Load the specified dictionary
+            # Load the specified dictionary (cached across instances)
             try:
-                dictionary = Dictionary(dict=self.dictionary_type)
+                dictionary = _load_dictionary(self.dictionary_type)
             except ModuleNotFoundError as e:
                 raise TokenizerInitializationError(
                     f"Sudachi dictionary '{self.dictionary_type}' not found. "
                     f"Please install it with: pip install sudachidict-{self.dictionary_type}"
                 ) from e
 
-            # Map our enum to Sudachi's SplitMode
-            mode_map = {
-                TokenizationMode.SHORT: SudachiTokenizer.SplitMode.A,
-                TokenizationMode.MEDIUM: SudachiTokenizer.SplitMode.B,
-                TokenizationMode.LONG: SudachiTokenizer.SplitMode.C,
-            }
-
-            self._tokenizer = dictionary.create(mode=mode_map[self.mode])
+            self._tokenizer = dictionary.create(mode=self._SPLIT_MODES[self.mode])
+            # Reusable output buffer for Sudachi results. Passing it as
+            # tokenize(out=...) lets sudachi.rs overwrite one MorphemeList
+            # instead of allocating a fresh one per call. Safe because every
+            # call site extracts all morpheme fields into Token objects
+            # before the next tokenize call, and instances are not shared
+            # across threads (process-pool parallelism builds one instance
+            # per worker).
+            self._morpheme_buffer = self._tokenizer.tokenize("")
 
         except Exception as e:
             raise TokenizerInitializationError(
                 f"Failed to initialize Sudachi tokenizer: {e}"
             ) from e
 
-    def _contains_japanese(self, text: str) -> bool:
+    @staticmethod
+    def _contains_japanese(text: str) -> bool:
         """Check if text contains Japanese characters.
 
+        Thin wrapper over the module-level is_japanese_text.
+
         Args:
             text: Text to check
 
         Returns:
             True if text contains hiragana, katakana, or kanji characters
         """
-        return bool(self._JAPANESE_PATTERN.search(text))
+        # Same ASCII fast path as is_japanese_text, inlined to keep the
+        # per-line calls in tokenize_file free of an extra function call.
+        return not text.isascii() and _JAPANESE_SEARCH(text) is not None
 
     def _validate_text_content(self, text: str, source: str = "input") -> None:
         """Validate that text contains Japanese characters.
 
+        Callers guard on require_japanese before calling, so tokenizers
+        configured for mixed-language input skip the method call (and the
+        regex scan) entirely.
+
         Args:
             text: Text to validate
             source: Description of the text source for error messages
 
         Raises:
-            TokenizationError: If text contains no Japanese characters and require_japanese is True
+            TokenizationError: If text contains no Japanese characters
         """
-        if self.require_japanese and not self._contains_japanese(text):
-            raise TokenizationError(
-                f"No Japanese text detected in {source}.\n"
-                f"The text appears to contain no hiragana, katakana, or kanji characters.\n"
-                f"Suggestions:\n"
-                f"  - Verify the file contains Japanese text\n"
-                f"  - Check if the file encoding is correct (should be UTF-8)\n"
-                f"  - If processing mixed-language text, set require_japanese=False"
-            )
+        if not self._contains_japanese(text):
+            raise TokenizationError(self._no_japanese_message(source))
 
-    def _is_likely_binary(self, file_path: Path) -> bool:
-        """Check if a file is likely binary (non-text) content.
+    @staticmethod
+    def _no_japanese_message(source: str) -> str:
+        """Build the error message for input with no Japanese characters.
 
         Args:
-            file_path: Path to the file to check
+            source: Description of the text source for the message
 
         Returns:
-            True if file appears to be binary
+            The formatted error message
         """
-        try:
-            # Read first 8KB to check for binary content
-            with open(file_path, "rb") as f:
-                chunk = f.read(8192)
+        return (
+            f"No Japanese text detected in {source}.\n"
+            f"The text appears to contain no hiragana, katakana, or kanji characters.\n"
+            f"Suggestions:\n"
+            f"  - Verify the file contains Japanese text\n"
+            f"  - Check if the file encoding is correct (should be UTF-8)\n"
+            f"  - If processing mixed-language text, set require_japanese=False"
+        )
+
+    @staticmethod
+    def _is_binary_chunk(chunk: bytes) -> bool:
+        """Check if a leading chunk of file content looks binary (non-text).
 
-            # Check for null bytes (common in binary files)
-            if b"\x00" in chunk:
-                return True
+        Args:
+            chunk: The first few KB of the file
+
+        Returns:
+            True if the chunk appears to be binary
+        """
+        # Check for null bytes (common in binary files)
+        if b"\x00" in chunk:
+            return True
+
+        # Check for high ratio of non-printable characters. Deleting the
+        # text bytes in C via translate and measuring what's left is far
+        # faster than a Python-level loop over the 8KB sample.
+        non_text = len(chunk.translate(None, delete=_TEXT_BYTES))
 
-            # Check for high ratio of non-printable characters
-            text_chars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)))
-            non_text = sum(1 for byte in chunk if byte not in text_chars)
+        # If more than 30% non-text characters, likely binary
+        return len(chunk) > 0 and non_text / len(chunk) > 0.3
 
-            # If more than 30% non-text characters, likely binary
-            return len(chunk) > 0 and non_text / len(chunk) > 0.3
+    @staticmethod
+    def _detect_encoding(file_path: Path) -> str | None:
+        """Best-effort encoding guess for a file that failed UTF-8 decoding.
 
-        except Exception:
-            # If we can't read the file, assume it might be binary
-            return False
+        Uses charset-normalizer when it is installed and returns None
+        otherwise. Only called on the error path, so valid UTF-8 files never
+        pay for the import or the detection scan.
+
+        Args:
+            file_path: Path to the file that failed to decode
+
+        Returns:
+            The detected encoding name, or None if unavailable or unknown
+        """
+        try:
+            from charset_normalizer import from_bytes
+        except ModuleNotFoundError:
+            return None
+        try:
+            with open(file_path, "rb") as f:
+                sample = f.read(65536)
+            best = from_bytes(sample).best()
+        except OSError:
+            return None
+        return best.encoding if best is not None else None
 
     def tokenize_text(self, text: str, partial_ok: bool = False) -> list[Token]:
         """Tokenize Japanese text into individual tokens.
@@ -261,76 +561,456 @@ class JapaneseTokenizer:
         Raises:
             TokenizationError: If tokenization fails and partial_ok is False
 
+        Note:
+            Results for partial_ok=False calls are cached per input string
+            (see _TOKENIZE_CACHE_SIZE), so repeated inputs skip Sudachi.
+            Callers receive fresh Token copies, so mutating them (e.g.
+            rebasing positions) cannot corrupt the cache.
+
         Example:
             >>> tokenizer = JapaneseTokenizer()
             >>> tokens = tokenizer.tokenize_text("食べた")
             >>> tokens[0].dictionary_form
             '食べる'
         """
-        if not text or not text.strip():
+        # str.isspace avoids the stripped-copy allocation strip() would make
+        if not text or text.isspace():
+            return []
+
+        self._require_tokenizer()
+
+        # Validate text contains Japanese if required
+        if self.require_japanese:
+            self._validate_text_content(text, "input text")
+
+        if len(text) > _CHUNK_SIZE:
+            return self._tokenize_chunked(text, partial_ok)
+
+        if partial_ok:
+            # The lossy recovery path is not cached; its output depends on
+            # which morphemes happen to fail.
+            return self._tokenize_segment(text, partial_ok=True)
+
+        # Copy tokens out of the cache: Token is mutable (the chunked paths
+        # rebase position in place), so handing out the memoized instances
+        # would let callers corrupt results for later identical inputs.
+        return [replace(token) for token in self._tokenize_cached(text)]
+
+    def tokenize_batch(
+        self, texts: Iterable[str], partial_ok: bool = False
+    ) -> list[list[Token]]:
+        """Tokenize multiple texts with one hot tokenizer.
+
+        Convenience over calling tokenize_text in a loop: the Sudachi
+        tokenizer, dictionary, and memoization cache stay warm across the
+        whole batch, and duplicate texts are tokenized only once.
+
+        Args:
+            texts: Texts to tokenize, one result list per input
+            partial_ok: If True, continue processing even if some segments fail (default: False)
+
+        Returns:
+            A list of token lists, in the same order as the inputs
+
+        Raises:
+            TokenizationError: If tokenization of any text fails and partial_ok is False
+
+        Example:
+            >>> tokenizer = JapaneseTokenizer()
+            >>> results = tokenizer.tokenize_batch(["食べた", "飲んだ"])
+            >>> [tokens[0].dictionary_form for tokens in results]
+            ['食べる', '飲む']
+        """
+        return [self.tokenize_text(text, partial_ok=partial_ok) for text in texts]
+
+    def tokenize_stream(
+        self,
+        texts: Iterable[str],
+        partial_ok: bool = False,
+        apply_filters: bool = True,
+    ) -> Iterator[Token]:
+        """Tokenize a stream of texts lazily, yielding tokens as produced.
+
+        Generator counterpart to tokenize_batch for pipelined consumers:
+        each input is pulled and tokenized only when the consumer reaches
+        it, so a producer reading lines from slow storage overlaps its I/O
+        with tokenization and at most one text's tokens are materialized at
+        a time.
+
+        Args:
+            texts: Texts to tokenize, consumed lazily
+            partial_ok: If True, continue processing even if some segments fail (default: False)
+            apply_filters: If True, run each text's tokens through the
+                configured filter chain before yielding (default: True)
+
+        Yields:
+            Token objects in input order
+
+        Raises:
+            TokenizationError: If tokenization of any text fails and partial_ok is False
+
+        Example:
+            >>> tokenizer = JapaneseTokenizer()
+            >>> next(tokenizer.tokenize_stream(["食べた"])).surface
+            '食べ'
+        """
+        for text in texts:
+            tokens = self.tokenize_text(text, partial_ok=partial_ok)
+            if apply_filters:
+                tokens = self.apply_filters(tokens)
+            yield from tokens
+
+    def tokenize_text_columns(
+        self, text: str, partial_ok: bool = False
+    ) -> TokenColumns:
+        """Tokenize text into column-oriented parallel arrays.
+
+        Structure-of-arrays counterpart to tokenize_text for callers doing
+        bulk per-field work (frequency tables, surface dedup): each field
+        comes back as one flat list instead of being scattered across Token
+        objects.
+
+        Args:
+            text: Japanese text to tokenize
+            partial_ok: If True, continue processing even if some segments fail (default: False)
+
+        Returns:
+            A TokenColumns with one entry per token in each column
+
+        Raises:
+            TokenizationError: If tokenization fails and partial_ok is False
+
+        Example:
+            >>> tokenizer = JapaneseTokenizer()
+            >>> columns = tokenizer.tokenize_text_columns("私は食べた")
+            >>> columns.surfaces
+            ['私', 'は', '食べ', 'た']
+        """
+        return TokenColumns.from_tokens(self.tokenize_text(text, partial_ok=partial_ok))
+
+    def tokenize_text_iter(
+        self, text: str, partial_ok: bool = False
+    ) -> Iterator[Token]:
+        """Tokenize text lazily, yielding tokens as chunks are processed.
+
+        Generator counterpart to tokenize_text for callers that consume
+        tokens one at a time: large inputs are tokenized chunk by chunk, so
+        only one chunk's worth of tokens is materialized at once. Results
+        are not memoized.
+
+        Args:
+            text: Japanese text to tokenize
+            partial_ok: If True, continue processing even if some segments fail (default: False)
+
+        Yields:
+            Token objects in text order
+
+        Raises:
+            TokenizationError: If tokenization fails and partial_ok is False
+
+        Example:
+            >>> tokenizer = JapaneseTokenizer()
+            >>> next(tokenizer.tokenize_text_iter("食べた")).surface
+            '食べ'
+        """
+        # Validate eagerly so errors surface at the call, not at first next()
+        if not text or text.isspace():
+            return iter(())
+
+        self._require_tokenizer()
+
+        if self.require_japanese:
+            self._validate_text_content(text, "input text")
+
+        def generate() -> Iterator[Token]:
+            for offset, chunk in _iter_line_chunks(text):
+                chunk_tokens = self._tokenize_segment(chunk, partial_ok)
+                if offset:
+                    for token in chunk_tokens:
+                        token.position += offset
+                yield from chunk_tokens
+
+        return generate()
+
+    def tokenize_wakati(self, text: str) -> list[str]:
+        """Segment text into surface forms only (wakati-gaki).
+
+        Fast path for callers that just need the word boundaries: skips
+        building Token objects and extracting readings, POS tags, and
+        normalized forms, which roughly halves the Python-side cost per
+        morpheme.
+
+        Args:
+            text: Japanese text to segment
+
+        Returns:
+            List of surface strings in text order
+
+        Raises:
+            TokenizationError: If tokenization fails
+
+        Example:
+            >>> tokenizer = JapaneseTokenizer()
+            >>> tokenizer.tokenize_wakati("私は食べた")
+            ['私', 'は', '食べ', 'た']
+        """
+        if not text or text.isspace():
             return []
 
-        if self._tokenizer is None:
+        tokenizer = self._require_tokenizer()
+
+        if self.require_japanese:
+            self._validate_text_content(text, "input text")
+
+        try:
+            if len(text) > _CHUNK_SIZE:
+                surfaces: list[str] = []
+                for _, chunk in _iter_line_chunks(text):
+                    surfaces.extend(
+                        morpheme.surface()
+                        for morpheme in tokenizer.tokenize(
+                            chunk, out=self._morpheme_buffer
+                        )
+                    )
+                return surfaces
+            return [
+                morpheme.surface()
+                for morpheme in tokenizer.tokenize(text, out=self._morpheme_buffer)
+            ]
+        except TokenizationError:
+            raise
+        except Exception as e:
+            raise self._tokenization_failure(e) from e
+
+    def tokenize_files(
+        self,
+        file_paths: Iterable[Path | str],
+        partial_ok: bool = False,
+        max_workers: int | None = None,
+    ) -> list[list[Token]]:
+        """Tokenize multiple files, in parallel across processes when useful.
+
+        SudachiPy holds the GIL while tokenizing, so multi-document speedup
+        requires separate processes; each worker initializes its own
+        tokenizer (sharing nothing but the on-disk dictionary). Worker
+        startup costs a dictionary load, so parallelism only pays off for
+        batches of several non-trivial files — single-file calls run inline.
+
+        Args:
+            file_paths: Paths of text files to tokenize
+            partial_ok: If True, continue processing even if some segments fail (default: False)
+            max_workers: Worker process count (default: one per file, capped
+                at the CPU count). Pass 1 to force sequential processing.
+
+        Returns:
+            A list of token lists, in the same order as the input paths
+
+        Raises:
+            FileProcessingError: If any file cannot be read
+            TokenizationError: If tokenization of any file fails
+
+        Example:
+            >>> tokenizer = JapaneseTokenizer()
+            >>> results = tokenizer.tokenize_files(["a.txt", "b.txt"])
+            >>> len(results)
+            2
+        """
+        paths = [Path(p) if isinstance(p, str) else p for p in file_paths]
+
+        if max_workers is None:
+            max_workers = min(len(paths), os.cpu_count() or 1)
+
+        if len(paths) <= 1 or max_workers <= 1:
+            return [self.tokenize_file(path, partial_ok=partial_ok) for path in paths]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_tokenizer,
+            initargs=(self.mode, self.dictionary_type, self.require_japanese),
+        ) as executor:
+            return list(
+                executor.map(_tokenize_file_in_worker, paths, repeat(partial_ok))
+            )
+
+    def _require_tokenizer(self) -> SudachiTokenizer:
+        """Return the Sudachi tokenizer, raising if it is not initialized.
+
+        Returning the non-None tokenizer lets callers bind it to a local and
+        keeps the narrowing visible to mypy; reading self._tokenizer again
+        after the check would not.
+
+        Returns:
+            The initialized Sudachi tokenizer
+
+        Raises:
+            TokenizationError: If the tokenizer is not initialized
+        """
+        tokenizer = self._tokenizer
+        if tokenizer is None:
             raise TokenizationError(
                 "Tokenizer not initialized.\n"
                 "This is an internal error. Please report this issue."
             )
+        return tokenizer
 
-        # Validate text contains Japanese if required
-        self._validate_text_content(text, "input text")
+    def _tokenize_chunked(self, text: str, partial_ok: bool) -> list[Token]:
+        """Tokenize a large text in line-aligned chunks.
 
-        try:
-            morphemes = self._tokenizer.tokenize(text)
-            tokens: list[Token] = []
-
-            for morpheme in morphemes:
-                try:
-                    # Extract all required information from Sudachi morpheme
-                    surface = morpheme.surface()
-                    reading = morpheme.reading_form()
-                    pos = morpheme.part_of_speech()[0]  # Get primary POS tag
-                    base_form = morpheme.dictionary_form()
-                    normalized = morpheme.normalized_form()
-                    features = list(morpheme.part_of_speech())
-                    position = morpheme.begin()
-
-                    token = Token(
-                        surface=surface,
-                        reading=reading,
-                        part_of_speech=pos,
-                        base_form=base_form,
-                        normalized_form=normalized,
-                        features=features,
-                        position=position,
-                    )
-                    tokens.append(token)
-
-                except Exception as e:
-                    if partial_ok:
-                        # Log the error but continue processing
-                        # In production, this would use proper logging
-                        continue
-                    else:
-                        raise TokenizationError(
-                            f"Failed to process token at position {morpheme.begin()}: {e}\n"
-                            f"Surface form: {morpheme.surface()}\n"
-                            f"Suggestion: Try setting partial_ok=True to skip problematic tokens"
-                        ) from e
+        Each chunk is tokenized independently and token positions are shifted
+        by the chunk's offset so they remain offsets into the original text.
 
-            return tokens
+        Args:
+            text: Text to tokenize (longer than _CHUNK_SIZE)
+            partial_ok: If True, skip morphemes that fail to convert
+
+        Returns:
+            List of Token objects covering the whole text
+
+        Raises:
+            TokenizationError: If tokenization fails and partial_ok is False
+        """
+        tokens: list[Token] = []
+        for offset, chunk in _iter_line_chunks(text):
+            chunk_tokens = self._tokenize_segment(chunk, partial_ok)
+            if offset:
+                for token in chunk_tokens:
+                    token.position += offset
+            tokens.extend(chunk_tokens)
+        return tokens
+
+    def _tokenize_segment(self, segment: str, partial_ok: bool) -> list[Token]:
+        """Tokenize one pre-validated segment of text.
+
+        Skips the empty/Japanese validation done by tokenize_text; callers
+        are responsible for validating the overall input.
+
+        Args:
+            segment: Text segment to tokenize
+            partial_ok: If True, skip morphemes that fail to convert
+
+        Returns:
+            List of Token objects (positions relative to the segment)
+
+        Raises:
+            TokenizationError: If tokenization fails and partial_ok is False
+        """
+        if not segment or segment.isspace():
+            return []
+        if partial_ok:
+            tokenizer = self._require_tokenizer()
+            try:
+                return self._build_tokens_partial(
+                    tokenizer.tokenize(segment, out=self._morpheme_buffer)
+                )
+            except Exception as e:
+                raise self._tokenization_failure(e) from e
+        return list(self._tokenize_uncached(segment))
+
+    def _tokenize_uncached(self, text: str) -> tuple[Token, ...]:
+        """Run Sudachi and build tokens for the given text.
+
+        Returns an immutable tuple so results can be safely memoized by the
+        per-instance LRU cache.
+
+        Args:
+            text: Japanese text to tokenize (non-empty, already validated)
+
+        Returns:
+            Tuple of Token objects with linguistic metadata
+
+        Raises:
+            TokenizationError: If tokenization fails
+        """
+        tokenizer = self._require_tokenizer()
+        try:
+            morphemes = tokenizer.tokenize(text, out=self._morpheme_buffer)
+
+            # Hot path: build every token in one comprehension without a
+            # per-morpheme try/except; any failure is wrapped by the outer
+            # handler below. Sudachi hands back one shared POS tuple per
+            # POS id, so storing it directly avoids a per-token copy.
+            # Interning collapses the many repeats of common surfaces,
+            # readings, and lemmas (particles, auxiliaries, frequent words)
+            # into single shared string objects across the whole document.
+            # Token is bound to a local alias so each iteration avoids the
+            # global (module dict) lookup.
+            intern = sys.intern
+            token_cls = Token
+            return tuple(
+                token_cls(
+                    surface=intern(morpheme.surface()),
+                    reading=intern(morpheme.reading_form()),
+                    part_of_speech=(features := morpheme.part_of_speech())[0],
+                    base_form=intern(morpheme.dictionary_form()),
+                    normalized_form=intern(morpheme.normalized_form()),
+                    features=features,
+                    position=morpheme.begin(),
+                )
+                for morpheme in morphemes
+            )
 
         except TokenizationError:
             # Re-raise our custom errors
             raise
         except Exception as e:
-            raise TokenizationError(
-                f"Failed to tokenize text: {e}\n"
-                f"Suggestions:\n"
-                f"  - Verify the text is valid Japanese\n"
-                f"  - Check for unusual characters or formatting\n"
-                f"  - Try with a different tokenization mode\n"
-                f"  - Set partial_ok=True to skip problematic segments"
-            ) from e
+            raise self._tokenization_failure(e) from e
+
+    @staticmethod
+    def _tokenization_failure(cause: Exception) -> TokenizationError:
+        """Build the standard TokenizationError for an unexpected failure.
+
+        Args:
+            cause: The underlying exception
+
+        Returns:
+            A TokenizationError with recovery suggestions
+        """
+        return TokenizationError(
+            f"Failed to tokenize text: {cause}\n"
+            f"Suggestions:\n"
+            f"  - Verify the text is valid Japanese\n"
+            f"  - Check for unusual characters or formatting\n"
+            f"  - Try with a different tokenization mode\n"
+            f"  - Set partial_ok=True to skip problematic segments"
+        )
+
+    @staticmethod
+    def _build_tokens_partial(morphemes: Iterable[Any]) -> list[Token]:
+        """Build tokens from morphemes, skipping any that fail to convert.
+
+        Slower than the main comprehension path because of the per-morpheme
+        try/except; only used when partial_ok is requested.
+
+        Args:
+            morphemes: Morpheme list returned by Sudachi
+
+        Returns:
+            Tokens for every morpheme that converted successfully
+        """
+        tokens: list[Token] = []
+        intern = sys.intern
+        token_cls = Token
+        append = tokens.append
+        for morpheme in morphemes:
+            try:
+                features = morpheme.part_of_speech()
+                append(
+                    token_cls(
+                        surface=intern(morpheme.surface()),
+                        reading=intern(morpheme.reading_form()),
+                        part_of_speech=features[0],
+                        base_form=intern(morpheme.dictionary_form()),
+                        normalized_form=intern(morpheme.normalized_form()),
+                        features=features,
+                        position=morpheme.begin(),
+                    )
+                )
+            except Exception:
+                # Skip problematic morphemes and keep going
+                continue
+        return tokens
 
     def tokenize_file(
         self, file_path: Path | str, partial_ok: bool = False
@@ -348,57 +1028,168 @@ class JapaneseTokenizer:
             FileProcessingError: If file cannot be read or has encoding issues
             TokenizationError: If tokenization fails
 
+        Note:
+            The file is streamed line by line and tokenized in bounded
+            chunks, so peak memory stays flat even for very large files.
+
         Example:
             >>> tokenizer = JapaneseTokenizer()
             >>> tokens = tokenizer.tokenize_file("japanese_text.txt")
             >>> len(tokens) > 0
             True
         """
+        return list(self.tokenize_file_iter(file_path, partial_ok=partial_ok))
+
+    def tokenize_file_iter(
+        self, file_path: Path | str, partial_ok: bool = False
+    ) -> Iterator[Token]:
+        """Tokenize a file lazily, yielding tokens as chunks are read.
+
+        Unlike tokenize_file, the full token list is never materialized:
+        callers aggregating into a set or frequency table hold only one
+        bounded chunk of tokens at a time alongside their own accumulator.
+
+        Args:
+            file_path: Path to the text file to tokenize (Path object or string)
+            partial_ok: If True, continue processing even if some segments fail (default: False)
+
+        Yields:
+            Token objects with linguistic metadata, in document order
+
+        Raises:
+            FileProcessingError: If file cannot be read or has encoding issues
+            TokenizationError: If tokenization fails
+
+        Note:
+            This is a generator; validation errors (missing file, empty
+            file, no Japanese content) are raised during iteration, not at
+            the call itself. The empty-file and no-Japanese checks can only
+            fire once the end of the file is reached.
+        """
         # Convert string to Path if needed
         if isinstance(file_path, str):
             file_path = Path(file_path)
 
-        # Validate file exists
-        if not file_path.exists():
+        self._require_tokenizer()
+
+        # Validate the path with a single stat call instead of separate
+        # exists() and is_file() probes. Any other stat failure must still
+        # surface as FileProcessingError per the documented contract.
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
             raise FileProcessingError(
                 f"File not found: {file_path}\n"
                 f"Suggestions:\n"
                 f"  - Check that the file path is correct\n"
                 f"  - Verify the file exists in the specified location\n"
                 f"  - Use an absolute path if the relative path is unclear"
-            )
+            ) from None
+        except PermissionError as e:
+            raise FileProcessingError(
+                f"Permission denied: {file_path}\n"
+                f"You don't have permission to read this file.\n"
+                f"Suggestions:\n"
+                f"  - Check file permissions with 'ls -l {file_path}'\n"
+                f"  - Use 'chmod +r {file_path}' to add read permission\n"
+                f"  - Verify you have access to the parent directory"
+            ) from e
+        except OSError as e:
+            raise FileProcessingError(
+                f"Error reading file: {file_path}\n"
+                f"An OS error occurred while reading the file.\n"
+                f"Suggestions:\n"
+                f"  - Check if the file system is accessible\n"
+                f"  - Verify disk space is available\n"
+                f"  - Ensure the file is not locked by another process\n"
+                f"Original error: {e}"
+            ) from e
 
         # Validate it's a file (not a directory)
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise FileProcessingError(
                 f"Path is not a file: {file_path}\n"
                 f"The specified path points to a directory, not a file.\n"
                 f"Suggestion: Provide a path to a text file, not a directory."
             )
 
-        # Check if file is likely binary
-        if self._is_likely_binary(file_path):
+        # A zero-byte file can be rejected straight from the stat result we
+        # already hold, before paying for open(). Whitespace-only files are
+        # still caught by the streaming read below.
+        if file_stat.st_size == 0:
             raise FileProcessingError(
-                f"File appears to be binary (non-text): {file_path}\n"
-                f"This tokenizer only processes text files.\n"
-                f"Suggestions:\n"
-                f"  - Verify the file is a text file (.txt, .md, etc.)\n"
-                f"  - Check if the file is corrupted\n"
-                f"  - Ensure the file is not a compressed archive or image"
+                f"File is empty or contains only whitespace: {file_path}\n"
+                f"Suggestion: Provide a file with Japanese text content."
             )
 
-        # Try to read the file with UTF-8 encoding
+        # Stream the file with UTF-8 encoding, tokenizing bounded chunks as
+        # they are read instead of slurping the whole file into memory first.
+        found_content = False
+        found_japanese = not self.require_japanese
+
         try:
-            text = file_path.read_text(encoding="utf-8")
+            with open(file_path, "rb") as raw:
+                # Sniff the first 8KB for binary content on the same open
+                # instead of a second open/read/close round trip. A binary
+                # read() returns the full sample for regular files (peek()
+                # may legally return less), then the stream is rewound and
+                # UTF-8 decoding layered on top.
+                if self._is_binary_chunk(raw.read(8192)):
+                    raise FileProcessingError(
+                        f"File appears to be binary (non-text): {file_path}\n"
+                        f"This tokenizer only processes text files.\n"
+                        f"Suggestions:\n"
+                        f"  - Verify the file is a text file (.txt, .md, etc.)\n"
+                        f"  - Check if the file is corrupted\n"
+                        f"  - Ensure the file is not a compressed archive or image"
+                    )
+
+                raw.seek(0)
+                f = io.TextIOWrapper(raw, encoding="utf-8")
+
+                buffer: list[str] = []
+                buffer_start = 0
+                buffer_len = 0
+                position = 0
+
+                def flush_buffer(offset: int) -> list[Token]:
+                    segment = "".join(buffer)
+                    segment_tokens = self._tokenize_segment(segment, partial_ok)
+                    if offset:
+                        for token in segment_tokens:
+                            token.position += offset
+                    buffer.clear()
+                    return segment_tokens
+
+                for line in f:
+                    if not found_content and line and not line.isspace():
+                        found_content = True
+                    if not found_japanese and self._contains_japanese(line):
+                        found_japanese = True
+                    if buffer and buffer_len + len(line) > _CHUNK_SIZE:
+                        yield from flush_buffer(buffer_start)
+                        buffer_start = position
+                        buffer_len = 0
+                    buffer.append(line)
+                    buffer_len += len(line)
+                    position += len(line)
+
+                if buffer:
+                    yield from flush_buffer(buffer_start)
         except UnicodeDecodeError as e:
-            # Try to detect the actual encoding
+            # Try to detect the actual encoding so the error (and the iconv
+            # suggestion) can name it instead of guessing Shift-JIS
             error_position = getattr(e, "start", 0)
+            detected = self._detect_encoding(file_path)
+            detected_note = f"Detected encoding: {detected}\n" if detected else ""
+            iconv_from = (detected or "SHIFT-JIS").upper()
             raise FileProcessingError(
                 f"File encoding error: {file_path}\n"
                 f"The file is not valid UTF-8 (error at byte {error_position}).\n"
+                f"{detected_note}"
                 f"Suggestions:\n"
                 f"  - Convert the file to UTF-8 encoding\n"
-                f"  - Use 'iconv -f SHIFT-JIS -t UTF-8 input.txt > output.txt' for Japanese files\n"
+                f"  - Use 'iconv -f {iconv_from} -t UTF-8 input.txt > output.txt' for Japanese files\n"
                 f"  - Use a text editor like VS Code to convert encoding\n"
                 f"  - Common Japanese encodings: Shift-JIS, EUC-JP, ISO-2022-JP"
             ) from e
@@ -421,25 +1212,31 @@ class JapaneseTokenizer:
                 f"  - Ensure the file is not locked by another process\n"
                 f"Original error: {e}"
             ) from e
-
-        # Validate file is not empty
-        if not text or not text.strip():
-            raise FileProcessingError(
-                f"File is empty or contains only whitespace: {file_path}\n"
-                f"Suggestion: Provide a file with Japanese text content."
-            )
-
-        # Tokenize the text
-        try:
-            return self.tokenize_text(text, partial_ok=partial_ok)
         except TokenizationError as e:
             # Add file context to tokenization errors
             raise TokenizationError(
                 f"Error tokenizing file: {file_path}\n{str(e)}"
             ) from e
+        except FileProcessingError:
+            # Already carries file context (e.g. the binary-content check)
+            raise
         except Exception as e:
             raise FileProcessingError(
                 f"Unexpected error processing file: {file_path}\n"
                 f"Original error: {e}\n"
                 f"Suggestion: Please report this issue with the file details"
             ) from e
+
+        # Validate file is not empty
+        if not found_content:
+            raise FileProcessingError(
+                f"File is empty or contains only whitespace: {file_path}\n"
+                f"Suggestion: Provide a file with Japanese text content."
+            )
+
+        # Validate the file contained Japanese text if required
+        if not found_japanese:
+            raise TokenizationError(
+                f"Error tokenizing file: {file_path}\n"
+                f"{self._no_japanese_message('file')}"
+            )
@@ -6,10 +6,11 @@ extracted from Japanese text with its linguistic metadata.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Represents a single token extracted from Japanese text.
 
@@ -19,7 +20,9 @@ class Token:
         part_of_speech: Part-of-speech tag from Sudachi
         base_form: Dictionary/lemma form (e.g., "食べる" for all conjugated forms)
         normalized_form: Sudachi's normalized representation
-        features: Additional linguistic features from Sudachi
+        features: Additional linguistic features from Sudachi. The tokenizer
+            stores Sudachi's shared POS tuple here (one object per POS id)
+            rather than a per-token copy.
         position: Character offset in the original text
     """
 
@@ -28,7 +31,7 @@ class Token:
     part_of_speech: str
     base_form: str
     normalized_form: str
-    features: list[str]
+    features: Sequence[str]
     position: int
 
     @property
@@ -38,4 +41,88 @@ class Token:
         Returns:
             The base form if available, otherwise the surface form.
         """
-        return self.base_form if self.base_form else self.surface
+        # Single-expression fallback: `or` evaluates base_form once instead
+        # of the test-then-load of a conditional expression.
+        return self.base_form or self.surface
+
+    @staticmethod
+    def batch_to_rows(
+        tokens: Sequence[Token],
+    ) -> list[tuple[str, str, str, str, str, int]]:
+        """Pack tokens into plain tuples for bulk export.
+
+        Export paths (CSV writers, Anki note rows) need every field of every
+        token; packing them into tuples in one comprehension is cheaper than
+        building a dict per token, and tuples feed directly into csv.writer
+        and str.join-style formatting.
+
+        Args:
+            tokens: Tokens to pack
+
+        Returns:
+            One (surface, reading, part_of_speech, dictionary_form,
+            normalized_form, position) tuple per token, in token order
+        """
+        return [
+            (
+                token.surface,
+                token.reading,
+                token.part_of_speech,
+                token.base_form or token.surface,
+                token.normalized_form,
+                token.position,
+            )
+            for token in tokens
+        ]
+
+
+@dataclass(slots=True)
+class TokenColumns:
+    """Column-oriented (structure-of-arrays) view of a token list.
+
+    Holds one parallel list per Token field instead of one object per token.
+    Bulk operations over a single attribute — deduplicating surfaces, counting
+    parts of speech, building frequency tables — run over a flat list of
+    strings with much better cache locality than iterating Token objects.
+
+    Attributes:
+        surfaces: Surface forms, in token order
+        readings: Katakana readings, in token order
+        parts_of_speech: Part-of-speech tags, in token order
+        base_forms: Dictionary/lemma forms, in token order
+        normalized_forms: Sudachi normalized representations, in token order
+        positions: Character offsets in the original text, in token order
+    """
+
+    surfaces: list[str]
+    readings: list[str]
+    parts_of_speech: list[str]
+    base_forms: list[str]
+    normalized_forms: list[str]
+    positions: list[int]
+
+    @classmethod
+    def from_tokens(cls, tokens: Sequence[Token]) -> TokenColumns:
+        """Transpose a token list into parallel per-field columns.
+
+        Args:
+            tokens: Tokens to transpose
+
+        Returns:
+            A TokenColumns with one entry per token in each column
+        """
+        # One comprehension per column: each is a tight C-level loop over
+        # fixed slot offsets, which beats a single Python loop appending to
+        # six lists.
+        return cls(
+            surfaces=[token.surface for token in tokens],
+            readings=[token.reading for token in tokens],
+            parts_of_speech=[token.part_of_speech for token in tokens],
+            base_forms=[token.base_form for token in tokens],
+            normalized_forms=[token.normalized_form for token in tokens],
+            positions=[token.position for token in tokens],
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of tokens in the columns."""
+        return len(self.surfaces)
@@ -0,0 +1,64 @@
+"""Shared pytest fixtures for the test suite.
+
+Constructing a JapaneseTokenizer is the most expensive step in most tests
+(Sudachi dictionary load), while almost every test only reads from it. The
+session-scoped fixtures below build one tokenizer per configuration for the
+whole run; tests that mutate tokenizer state (filters, simulated init
+failure) construct their own throwaway instances instead.
+
+Under pytest-xdist, "session" scope means one tokenizer per worker process,
+which is exactly what we want: workers share nothing, so the suite can run
+with ``pytest -n auto``.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from txt_to_anki.tokenizer import JapaneseTokenizer, TokenizationMode
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --runslow option for opting into scale smoke tests."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (large-input smoke tests)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip slow-marked tests unless --runslow was given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def tokenizer() -> JapaneseTokenizer:
+    """One default tokenizer (MEDIUM mode, require_japanese=True) per run."""
+    return JapaneseTokenizer()
+
+
+@pytest.fixture(scope="session")
+def lenient_tokenizer() -> JapaneseTokenizer:
+    """One tokenizer accepting non-Japanese input per run."""
+    return JapaneseTokenizer(require_japanese=False)
+
+
+@pytest.fixture(scope="session")
+def short_tokenizer() -> JapaneseTokenizer:
+    """One SHORT-mode tokenizer per run."""
+    return JapaneseTokenizer(mode=TokenizationMode.SHORT)
+
+
+@pytest.fixture(scope="session")
+def long_tokenizer() -> JapaneseTokenizer:
+    """One LONG-mode tokenizer per run."""
+    return JapaneseTokenizer(mode=TokenizationMode.LONG)
@@ -0,0 +1,193 @@
+"""Tests for token filtering functionality."""
+
+from __future__ import annotations
+
+from txt_to_anki.tokenizer import JapaneseTokenizer, Token
+from txt_to_anki.tokenizer.filters import (
+    ParticleFilter,
+    POSFilter,
+    PunctuationFilter,
+    TokenFilter,
+)
+
+
+def make_token(surface: str, part_of_speech: str) -> Token:
+    """Create a Token with minimal metadata for filter tests."""
+    return Token(
+        surface=surface,
+        reading=surface,
+        part_of_speech=part_of_speech,
+        base_form=surface,
+        normalized_form=surface,
+        features=[part_of_speech],
+        position=0,
+    )
+
+
+class TestParticleFilter:
+    """Tests for ParticleFilter."""
+
+    def test_removes_particles(self) -> None:
+        """Test that particle tokens are removed."""
+        tokens = [
+            make_token("私", "代名詞"),
+            make_token("は", "助詞"),
+            make_token("日本語", "名詞"),
+            make_token("を", "助詞"),
+            make_token("勉強", "名詞"),
+        ]
+
+        filtered = ParticleFilter().filter(tokens)
+
+        surfaces = [t.surface for t in filtered]
+        assert surfaces == ["私", "日本語", "勉強"]
+
+    def test_keeps_non_particles(self) -> None:
+        """Test that non-particle tokens pass through unchanged."""
+        tokens = [make_token("天気", "名詞"), make_token("良い", "形容詞")]
+
+        filtered = ParticleFilter().filter(tokens)
+
+        assert filtered == tokens
+
+    def test_empty_list(self) -> None:
+        """Test filtering an empty token list returns an empty list."""
+        assert ParticleFilter().filter([]) == []
+
+    def test_keep_predicate(self) -> None:
+        """Test the per-token keep predicate."""
+        particle_filter = ParticleFilter()
+
+        assert particle_filter.keep(make_token("天気", "名詞"))
+        assert not particle_filter.keep(make_token("は", "助詞"))
+
+    def test_satisfies_token_filter_protocol(self) -> None:
+        """Test that ParticleFilter satisfies the TokenFilter protocol."""
+        assert isinstance(ParticleFilter(), TokenFilter)
+
+
+class TestPunctuationFilter:
+    """Tests for PunctuationFilter."""
+
+    def test_removes_punctuation_and_symbols(self) -> None:
+        """Test that punctuation and symbol tokens are removed."""
+        tokens = [
+            make_token("元気", "名詞"),
+            make_token("？", "補助記号"),
+            make_token("♪", "記号"),
+        ]
+
+        filtered = PunctuationFilter().filter(tokens)
+
+        assert [t.surface for t in filtered] == ["元気"]
+
+    def test_keep_predicate(self) -> None:
+        """Test the per-token keep predicate."""
+        punctuation_filter = PunctuationFilter()
+
+        assert punctuation_filter.keep(make_token("元気", "名詞"))
+        assert not punctuation_filter.keep(make_token("。", "補助記号"))
+
+    def test_satisfies_token_filter_protocol(self) -> None:
+        """Test that PunctuationFilter satisfies the TokenFilter protocol."""
+        assert isinstance(PunctuationFilter(), TokenFilter)
+
+
+class TestPOSFilter:
+    """Tests for POSFilter."""
+
+    def test_removes_excluded_pos_tags(self) -> None:
+        """Test that tokens with excluded POS tags are removed."""
+        tokens = [
+            make_token("私", "代名詞"),
+            make_token("は", "助詞"),
+            make_token("です", "助動詞"),
+            make_token("勉強", "名詞"),
+        ]
+
+        filtered = POSFilter(exclude={"助詞", "助動詞"}).filter(tokens)
+
+        assert [t.surface for t in filtered] == ["私", "勉強"]
+
+    def test_empty_exclude_set_keeps_everything(self) -> None:
+        """Test that an empty exclusion set keeps all tokens."""
+        tokens = [make_token("は", "助詞")]
+
+        assert POSFilter(exclude=set()).filter(tokens) == tokens
+
+    def test_keep_predicate(self) -> None:
+        """Test the per-token keep predicate."""
+        pos_filter = POSFilter(exclude={"助詞"})
+
+        assert pos_filter.keep(make_token("天気", "名詞"))
+        assert not pos_filter.keep(make_token("は", "助詞"))
+
+    def test_satisfies_token_filter_protocol(self) -> None:
+        """Test that POSFilter satisfies the TokenFilter protocol."""
+        assert isinstance(POSFilter(exclude={"助詞"}), TokenFilter)
+
+
+class TestFilterChain:
+    """Tests for the tokenizer's filter chain."""
+
+    def test_no_filters_returns_tokens_unchanged(self) -> None:
+        """Test that apply_filters without filters is a no-op."""
+        tokenizer = JapaneseTokenizer()
+        tokens = [make_token("天気", "名詞")]
+
+        assert tokenizer.apply_filters(tokens) == tokens
+
+    def test_add_filter_applies_in_chain(self) -> None:
+        """Test that added filters are applied to the token list."""
+        tokenizer = JapaneseTokenizer()
+        tokenizer.add_filter(ParticleFilter())
+
+        tokens = [make_token("私", "代名詞"), make_token("は", "助詞")]
+        filtered = tokenizer.apply_filters(tokens)
+
+        assert [t.surface for t in filtered] == ["私"]
+
+    def test_multiple_filters_fused_into_single_pass(self) -> None:
+        """Test that multiple predicate filters produce combined results."""
+        tokenizer = JapaneseTokenizer()
+        tokenizer.set_filters([ParticleFilter(), PunctuationFilter()])
+
+        tokens = [
+            make_token("私", "代名詞"),
+            make_token("は", "助詞"),
+            make_token("元気", "名詞"),
+            make_token("。", "補助記号"),
+        ]
+        filtered = tokenizer.apply_filters(tokens)
+
+        assert [t.surface for t in filtered] == ["私", "元気"]
+
+    def test_filter_without_keep_predicate(self) -> None:
+        """Test that filters without a keep predicate still work."""
+
+        class FirstTokenOnly:
+            def filter(self, tokens: list[Token]) -> list[Token]:
+                return tokens[:1]
+
+        tokenizer = JapaneseTokenizer()
+        tokenizer.set_filters([ParticleFilter(), FirstTokenOnly()])
+
+        tokens = [
+            make_token("は", "助詞"),
+            make_token("私", "代名詞"),
+            make_token("元気", "名詞"),
+        ]
+        filtered = tokenizer.apply_filters(tokens)
+
+        assert [t.surface for t in filtered] == ["私"]
+
+    def test_set_filters_replaces_chain(self) -> None:
+        """Test that set_filters replaces previously added filters."""
+        tokenizer = JapaneseTokenizer()
+        tokenizer.add_filter(ParticleFilter())
+        tokenizer.set_filters([PunctuationFilter()])
+
+        tokens = [make_token("は", "助詞"), make_token("。", "補助記号")]
+        filtered = tokenizer.apply_filters(tokens)
+
+        assert [t.surface for t in filtered] == ["は"]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import tempfile
+from collections.abc import Iterator
+from itertools import pairwise
 from pathlib import Path
 
 import pytest
@@ -11,9 +12,50 @@ from txt_to_anki.tokenizer import (
     FileProcessingError,
     JapaneseTokenizer,
     Token,
+    TokenColumns,
     TokenizationError,
     TokenizationMode,
     TokenizerInitializationError,
+    is_japanese_text,
+)
+from txt_to_anki.tokenizer.filters import FUNCTION_WORD_POS, NON_CONTENT_POS
+from txt_to_anki.tokenizer.japanese_tokenizer import (
+    _iter_line_chunks,
+    _iter_sentence_chunks,
+)
+
+# Pre-encoded file payloads: write_bytes skips the text-I/O encoding layer,
+# keeping each file test pure I/O plus assertions.
+SAMPLE_JP_BYTES = "今日は良い天気です。".encode("utf-8")
+BINARY_BYTES = b"\x00\x01\x02\x03\x04\x05"
+SHIFT_JIS_BYTES = "今日は良い天気です。".encode("shift_jis")
+
+# Real-world sample checked once at collection time; tests that need it are
+# skipped (not silently passed) when it is absent.
+SAMPLE_FILE = Path("resources/お隣遊び - ぺんたごん.txt")
+requires_sample_file = pytest.mark.skipif(
+    not SAMPLE_FILE.exists(), reason="sample file not present"
+)
+
+# Shared sample tokens for the pure-dataclass tests below. These are value
+# checks only; no test mutates them.
+_VERB_TOKEN = Token(
+    surface="食べた",
+    reading="タベタ",
+    part_of_speech="動詞",
+    base_form="食べる",
+    normalized_form="食べる",
+    features=["動詞", "一般", "*", "*"],
+    position=3,
+)
+_GREETING_TOKEN = Token(
+    surface="こんにちは",
+    reading="コンニチハ",
+    part_of_speech="感動詞",
+    base_form="",
+    normalized_form="こんにちは",
+    features=["感動詞", "一般", "*", "*"],
+    position=0,
 )
 
 
@@ -22,57 +64,52 @@ class TestToken:
 
     def test_token_creation(self) -> None:
         """Test creating a Token instance."""
-        token = Token(
-            surface="食べた",
-            reading="タベタ",
-            part_of_speech="動詞",
-            base_form="食べる",
-            normalized_form="食べる",
-            features=["動詞", "一般", "*", "*"],
-            position=0,
-        )
-
-        assert token.surface == "食べた"
-        assert token.reading == "タベタ"
-        assert token.base_form == "食べる"
-        assert token.dictionary_form == "食べる"
+        assert _VERB_TOKEN.surface == "食べた"
+        assert _VERB_TOKEN.reading == "タベタ"
+        assert _VERB_TOKEN.base_form == "食べる"
+        assert _VERB_TOKEN.dictionary_form == "食べる"
 
     def test_dictionary_form_fallback(self) -> None:
         """Test dictionary_form falls back to surface when base_form is empty."""
-        token = Token(
-            surface="こんにちは",
-            reading="コンニチハ",
-            part_of_speech="感動詞",
-            base_form="",
-            normalized_form="こんにちは",
-            features=["感動詞", "一般", "*", "*"],
-            position=0,
-        )
+        assert _GREETING_TOKEN.dictionary_form == "こんにちは"
 
-        assert token.dictionary_form == "こんにちは"
+    def test_batch_to_rows(self) -> None:
+        """Test packing tokens into export rows."""
+        rows = Token.batch_to_rows([_VERB_TOKEN])
 
+        assert rows == [("食べた", "タベタ", "動詞", "食べる", "食べる", 3)]
 
-class TestJapaneseTokenizer:
-    """Tests for JapaneseTokenizer class."""
+    def test_batch_to_rows_dictionary_form_fallback(self) -> None:
+        """Test that rows fall back to surface when base_form is empty."""
+        rows = Token.batch_to_rows([_GREETING_TOKEN])
 
-    def test_tokenizer_initialization(self) -> None:
-        """Test tokenizer can be initialized."""
-        tokenizer = JapaneseTokenizer()
-        assert tokenizer.mode == TokenizationMode.MEDIUM
+        assert rows[0][3] == "こんにちは"
 
-    def test_tokenizer_with_mode(self) -> None:
-        """Test tokenizer initialization with different modes."""
-        tokenizer = JapaneseTokenizer(mode=TokenizationMode.SHORT)
-        assert tokenizer.mode == TokenizationMode.SHORT
 
-    def test_tokenizer_with_dictionary_type(self) -> None:
-        """Test tokenizer initialization with specific dictionary type."""
-        tokenizer = JapaneseTokenizer(dictionary_type="full")
-        assert tokenizer.dictionary_type == "full"
+class TestJapaneseTokenizer:
+    """Tests for JapaneseTokenizer class."""
 
-    def test_tokenize_simple_text(self) -> None:
+    @pytest.mark.parametrize(
+        ("fixture_name", "attr", "expected"),
+        [
+            ("tokenizer", "mode", TokenizationMode.MEDIUM),
+            ("tokenizer", "dictionary_type", "full"),
+            ("short_tokenizer", "mode", TokenizationMode.SHORT),
+            ("long_tokenizer", "mode", TokenizationMode.LONG),
+        ],
+    )
+    def test_tokenizer_attributes(
+        self,
+        request: pytest.FixtureRequest,
+        fixture_name: str,
+        attr: str,
+        expected: object,
+    ) -> None:
+        """Test that constructor arguments are reflected as attributes."""
+        assert getattr(request.getfixturevalue(fixture_name), attr) == expected
+
+    def test_tokenize_simple_text(self, tokenizer: JapaneseTokenizer) -> None:
         """Test tokenizing simple Japanese text."""
-        tokenizer = JapaneseTokenizer()
         tokens = tokenizer.tokenize_text("今日は良い天気です。")
 
         assert len(tokens) > 0
@@ -86,36 +123,35 @@ class TestJapaneseTokenizer:
             assert isinstance(token.base_form, str)
             assert isinstance(token.dictionary_form, str)
 
-    def test_tokenize_verb_conjugation(self) -> None:
+    def test_tokenize_verb_conjugation(self, tokenizer: JapaneseTokenizer) -> None:
         """Test that verb conjugations are normalized to dictionary form."""
-        tokenizer = JapaneseTokenizer()
         tokens = tokenizer.tokenize_text("食べた")
 
-        # Find the verb token
-        verb_tokens = [t for t in tokens if "動詞" in t.part_of_speech]
-        assert len(verb_tokens) > 0
+        # Find the first verb token; next() stops at the first match instead
+        # of building a filtered list
+        verb_token = next((t for t in tokens if "動詞" in t.part_of_speech), None)
+        assert verb_token is not None
 
         # The dictionary form should be the base form (食べる)
-        verb_token = verb_tokens[0]
         assert verb_token.surface == "食べ"
         assert verb_token.base_form == "食べる"
         assert verb_token.dictionary_form == "食べる"
 
-    def test_tokenize_empty_text(self) -> None:
-        """Test tokenizing empty text returns empty list."""
-        tokenizer = JapaneseTokenizer()
-        tokens = tokenizer.tokenize_text("")
-        assert tokens == []
+    @pytest.mark.parametrize("text", ["", "   \n\t  "], ids=["empty", "whitespace"])
+    @pytest.mark.parametrize("fixture_name", ["tokenizer", "lenient_tokenizer"])
+    def test_tokenize_empty_or_whitespace_returns_empty_list(
+        self, request: pytest.FixtureRequest, fixture_name: str, text: str
+    ) -> None:
+        """Test that empty and whitespace-only text return empty lists.
 
-    def test_tokenize_whitespace_only(self) -> None:
-        """Test tokenizing whitespace-only text returns empty list."""
-        tokenizer = JapaneseTokenizer()
-        tokens = tokenizer.tokenize_text("   \n\t  ")
-        assert tokens == []
+        Covers both require_japanese settings: the short-circuit happens
+        before validation, so neither tokenizer should raise.
+        """
+        tokenizer: JapaneseTokenizer = request.getfixturevalue(fixture_name)
+        assert tokenizer.tokenize_text(text) == []
 
-    def test_tokenize_mixed_scripts(self) -> None:
+    def test_tokenize_mixed_scripts(self, tokenizer: JapaneseTokenizer) -> None:
         """Test tokenizing text with hiragana, katakana, and kanji."""
-        tokenizer = JapaneseTokenizer()
         tokens = tokenizer.tokenize_text("私はコーヒーを飲みます。")
 
         assert len(tokens) > 0
@@ -124,30 +160,26 @@ class TestJapaneseTokenizer:
         surfaces = [t.surface for t in tokens]
         assert any(t for t in surfaces)  # Should have multiple tokens
 
-    def test_token_positions(self) -> None:
+    def test_token_positions(self, tokenizer: JapaneseTokenizer) -> None:
         """Test that tokens have correct position information."""
-        tokenizer = JapaneseTokenizer()
         tokens = tokenizer.tokenize_text("今日は")
 
-        # Positions should be non-negative and increasing
-        for i, token in enumerate(tokens):
-            assert token.position >= 0
-            if i > 0:
-                assert token.position >= tokens[i - 1].position
+        # Positions should be non-negative and non-decreasing; pairwise
+        # walks adjacent tokens without the index bookkeeping
+        assert all(token.position >= 0 for token in tokens)
+        assert all(a.position <= b.position for a, b in pairwise(tokens))
 
-    def test_tokenize_with_punctuation(self) -> None:
+    def test_tokenize_with_punctuation(self, tokenizer: JapaneseTokenizer) -> None:
         """Test tokenizing text with punctuation marks."""
-        tokenizer = JapaneseTokenizer()
         tokens = tokenizer.tokenize_text("こんにちは！元気ですか？")
 
         assert len(tokens) > 0
         # Punctuation should be included as tokens
-        surfaces = [t.surface for t in tokens]
+        surfaces = {t.surface for t in tokens}
         assert "！" in surfaces or "？" in surfaces
 
-    def test_tokenize_complete_sentence(self) -> None:
+    def test_tokenize_complete_sentence(self, tokenizer: JapaneseTokenizer) -> None:
         """Test tokenizing a complete Japanese sentence."""
-        tokenizer = JapaneseTokenizer(mode=TokenizationMode.MEDIUM)
         text = "今日は良い天気ですね。"
         tokens = tokenizer.tokenize_text(text)
 
@@ -162,33 +194,25 @@ class TestJapaneseTokenizer:
             assert token.dictionary_form
 
         # Check specific tokens
-        surfaces = [t.surface for t in tokens]
+        # Set comprehension: multiple membership checks below are O(1) each
+        surfaces = {t.surface for t in tokens}
         assert "今日" in surfaces
         assert "天気" in surfaces
 
-    def test_tokenize_verb_normalization(self) -> None:
+    def test_tokenize_verb_normalization(self, tokenizer: JapaneseTokenizer) -> None:
         """Test that conjugated verbs are normalized to dictionary form."""
-        tokenizer = JapaneseTokenizer()
         text = "昨日、美味しいラーメンを食べた。"
         tokens = tokenizer.tokenize_text(text)
 
-        # Find tokens where surface differs from dictionary form
-        normalized_tokens = [
-            (t.surface, t.dictionary_form)
+        # The verb should be normalized (食べ -> 食べる); a single any() over
+        # a generator short-circuits at the first normalized verb
+        assert any(
+            t.surface != t.dictionary_form and "食べる" in t.dictionary_form
             for t in tokens
-            if t.surface != t.dictionary_form
-        ]
-
-        # Should have at least one normalized token (食べ -> 食べる)
-        assert len(normalized_tokens) > 0
-
-        # Verify the verb is normalized
-        verb_normalized = any("食べる" in dict_form for _, dict_form in normalized_tokens)
-        assert verb_normalized
+        )
 
-    def test_tokenize_with_readings(self) -> None:
+    def test_tokenize_with_readings(self, tokenizer: JapaneseTokenizer) -> None:
         """Test that tokens include katakana readings."""
-        tokenizer = JapaneseTokenizer()
         text = "私はコーヒーを飲みます。"
         tokens = tokenizer.tokenize_text(text)
 
@@ -201,427 +225,487 @@ class TestJapaneseTokenizer:
             assert isinstance(token.reading, str)
 
         # Check that we have various token types
-        surfaces = [t.surface for t in tokens]
+        surfaces = {t.surface for t in tokens}
         assert "私" in surfaces
         assert "コーヒー" in surfaces
         assert "飲み" in surfaces
 
 
+class TestBatchTokenization:
+    """Tests for batch tokenization of multiple texts."""
+
+    def test_tokenize_batch_preserves_order(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that batch results line up with their inputs."""
+        results = tokenizer.tokenize_batch(["食べた", "今日は良い天気ですね。"])
+
+        assert len(results) == 2
+        assert results[0][0].dictionary_form == "食べる"
+        assert len(results[1]) == 7
+
+    def test_tokenize_batch_empty_inputs(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that empty strings produce empty token lists."""
+        results = tokenizer.tokenize_batch(["", "食べた", "   "])
+
+        assert results[0] == []
+        assert len(results[1]) > 0
+        assert results[2] == []
+
+    def test_tokenize_files_sequential(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test multi-file tokenization on the inline (single-worker) path."""
+        files = []
+        for index, text in enumerate(["今日は良い天気です。", "私はコーヒーを飲みます。"]):
+            path = tmp_path / f"sample{index}.txt"
+            path.write_text(text, encoding="utf-8")
+            files.append(path)
+
+        results = tokenizer.tokenize_files(files, max_workers=1)
+
+        assert len(results) == 2
+        assert results == [tokenizer.tokenize_file(path) for path in files]
+
+    def test_tokenize_files_parallel_matches_sequential(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test that the process-pool path returns the same results."""
+        files = []
+        for index, text in enumerate(["今日は良い天気です。", "私はコーヒーを飲みます。"]):
+            path = tmp_path / f"sample{index}.txt"
+            path.write_text(text, encoding="utf-8")
+            files.append(path)
+
+        sequential = tokenizer.tokenize_files(files, max_workers=1)
+        parallel = tokenizer.tokenize_files(files, max_workers=2)
+
+        assert parallel == sequential
+
+    def test_tokenize_text_columns_matches_tokens(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test that the columnar view lines up with the token list."""
+        text = "私はコーヒーを飲みます。"
+
+        tokens = tokenizer.tokenize_text(text)
+        columns = tokenizer.tokenize_text_columns(text)
+
+        assert isinstance(columns, TokenColumns)
+        assert len(columns) == len(tokens)
+        assert columns.surfaces == [t.surface for t in tokens]
+        assert columns.base_forms == [t.base_form for t in tokens]
+        assert columns.positions == [t.position for t in tokens]
+
+    def test_tokenize_text_columns_empty_input(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test that empty input produces empty columns."""
+
+        columns = tokenizer.tokenize_text_columns("")
+
+        assert len(columns) == 0
+        assert columns.surfaces == []
+
+    def test_tokenize_batch_matches_tokenize_text(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test that batch results match individual tokenize_text calls."""
+        texts = ["私はコーヒーを飲みます。", "食べた"]
+
+        batch_results = tokenizer.tokenize_batch(texts)
+        individual_results = [tokenizer.tokenize_text(text) for text in texts]
+
+        assert batch_results == individual_results
+
+
+class TestIterTokenization:
+    """Tests for the lazy tokenize_text_iter generator."""
+
+    def test_iter_matches_tokenize_text(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that the generator yields the same tokens as the list API."""
+        text = "今日は良い天気ですね。"
+
+        assert list(tokenizer.tokenize_text_iter(text)) == tokenizer.tokenize_text(text)
+
+    def test_iter_empty_text(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that empty input yields nothing."""
+
+        assert list(tokenizer.tokenize_text_iter("")) == []
+
+    def test_iter_validates_eagerly(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that validation errors raise at the call, not at first next."""
+
+        with pytest.raises(TokenizationError):
+            tokenizer.tokenize_text_iter("English only")
+
+    def test_stream_matches_batch(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that streaming over texts yields the batch results flattened."""
+        texts = ["食べた", "今日は良い天気ですね。"]
+
+        streamed = list(tokenizer.tokenize_stream(texts))
+        batched = [
+            token for tokens in tokenizer.tokenize_batch(texts) for token in tokens
+        ]
+
+        assert streamed == batched
+
+    def test_stream_is_lazy(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that inputs are not consumed until the stream is iterated."""
+        consumed: list[str] = []
+
+        def producer() -> Iterator[str]:
+            for text in ["食べた", "飲んだ"]:
+                consumed.append(text)
+                yield text
+
+        stream = tokenizer.tokenize_stream(producer())
+        assert consumed == []
+
+        next(stream)
+        assert consumed == ["食べた"]
+
+
+class TestWakatiTokenization:
+    """Tests for the surface-only wakati fast path."""
+
+    def test_wakati_matches_tokenize_text_surfaces(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test that wakati output matches full tokenization surfaces."""
+        text = "私はコーヒーを飲みます。"
+
+        surfaces = tokenizer.tokenize_wakati(text)
+
+        assert surfaces == [t.surface for t in tokenizer.tokenize_text(text)]
+
+    def test_wakati_empty_text(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that empty and whitespace input returns an empty list."""
+
+        assert tokenizer.tokenize_wakati("") == []
+        assert tokenizer.tokenize_wakati("  \n ") == []
+
+    def test_wakati_requires_japanese(self, tokenizer: JapaneseTokenizer) -> None:
+        """Test that non-Japanese input still raises with require_japanese."""
+
+        with pytest.raises(TokenizationError):
+            tokenizer.tokenize_wakati("English only")
+
+
 class TestJapaneseTextValidation:
     """Tests for Japanese text detection and validation."""
 
     def test_contains_japanese_with_hiragana(self) -> None:
         """Test Japanese detection with hiragana text."""
-        tokenizer = JapaneseTokenizer()
-        assert tokenizer._contains_japanese("こんにちは")
+        assert is_japanese_text("こんにちは")
 
     def test_contains_japanese_with_katakana(self) -> None:
         """Test Japanese detection with katakana text."""
-        tokenizer = JapaneseTokenizer()
-        assert tokenizer._contains_japanese("コーヒー")
+        assert is_japanese_text("コーヒー")
 
     def test_contains_japanese_with_kanji(self) -> None:
         """Test Japanese detection with kanji text."""
-        tokenizer = JapaneseTokenizer()
-        assert tokenizer._contains_japanese("日本語")
+        assert is_japanese_text("日本語")
 
     def test_contains_japanese_with_mixed_scripts(self) -> None:
         """Test Japanese detection with mixed scripts."""
-        tokenizer = JapaneseTokenizer()
-        assert tokenizer._contains_japanese("私はコーヒーを飲みます。")
+        assert is_japanese_text("私はコーヒーを飲みます。")
 
     def test_contains_japanese_with_english_only(self) -> None:
         """Test Japanese detection returns False for English text."""
-        tokenizer = JapaneseTokenizer()
-        assert not tokenizer._contains_japanese("Hello World")
+        assert not is_japanese_text("Hello World")
 
     def test_contains_japanese_with_numbers_only(self) -> None:
         """Test Japanese detection returns False for numbers."""
-        tokenizer = JapaneseTokenizer()
-        assert not tokenizer._contains_japanese("12345")
+        assert not is_japanese_text("12345")
 
     def test_contains_japanese_with_mixed_english_japanese(self) -> None:
         """Test Japanese detection with mixed English and Japanese."""
-        tokenizer = JapaneseTokenizer()
-        assert tokenizer._contains_japanese("Hello 世界")
+        assert is_japanese_text("Hello 世界")
 
-    def test_tokenize_non_japanese_text_raises_error(self) -> None:
+    def test_tokenize_non_japanese_text_raises_error(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that non-Japanese text raises TokenizationError."""
-        tokenizer = JapaneseTokenizer(require_japanese=True)
 
-        with pytest.raises(TokenizationError) as exc_info:
+        with pytest.raises(
+            TokenizationError,
+            match=r"(?s)No Japanese text detected.*require_japanese=False",
+        ):
             tokenizer.tokenize_text("Hello World")
 
-        error_msg = str(exc_info.value)
-        assert "No Japanese text detected" in error_msg
-        assert "require_japanese=False" in error_msg
-
-    def test_tokenize_non_japanese_text_with_require_false(self) -> None:
+    def test_tokenize_non_japanese_text_with_require_false(
+        self, lenient_tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that non-Japanese text works with require_japanese=False."""
-        tokenizer = JapaneseTokenizer(require_japanese=False)
         # Should not raise an error, though results may be empty or unexpected
-        tokens = tokenizer.tokenize_text("Hello World")
+        tokens = lenient_tokenizer.tokenize_text("Hello World")
         # Just verify it doesn't crash
         assert isinstance(tokens, list)
 
-    def test_tokenize_empty_string_returns_empty_list(self) -> None:
-        """Test that empty string returns empty list without validation error."""
-        tokenizer = JapaneseTokenizer(require_japanese=True)
-        tokens = tokenizer.tokenize_text("")
-        assert tokens == []
-
-    def test_tokenize_whitespace_returns_empty_list(self) -> None:
-        """Test that whitespace-only string returns empty list."""
-        tokenizer = JapaneseTokenizer(require_japanese=True)
-        tokens = tokenizer.tokenize_text("   \n\t  ")
-        assert tokens == []
-
 
 class TestPartialProcessing:
     """Tests for graceful degradation with partial_ok parameter."""
 
-    def test_tokenize_with_partial_ok_continues_on_error(self) -> None:
+    def test_tokenize_with_partial_ok_continues_on_error(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that partial_ok allows processing to continue despite errors."""
-        tokenizer = JapaneseTokenizer()
         # Normal Japanese text should work fine with partial_ok
         tokens = tokenizer.tokenize_text("今日は良い天気です。", partial_ok=True)
         assert len(tokens) > 0
 
-    def test_tokenize_file_with_partial_ok(self) -> None:
+    def test_tokenize_file_with_partial_ok(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test file tokenization with partial_ok parameter."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("今日は良い天気です。")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_bytes(SAMPLE_JP_BYTES)
 
-        try:
-            tokenizer = JapaneseTokenizer()
-            tokens = tokenizer.tokenize_file(temp_path, partial_ok=True)
-            assert len(tokens) > 0
-        finally:
-            temp_path.unlink()
+        tokens = tokenizer.tokenize_file(temp_path, partial_ok=True)
+        assert len(tokens) > 0
 
-    def test_tokenize_with_partial_ok_false_raises_on_error(self) -> None:
+    def test_tokenize_with_partial_ok_false_raises_on_error(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that partial_ok=False raises errors for problematic text."""
-        tokenizer = JapaneseTokenizer()
         # Normal text should work fine even with partial_ok=False
         tokens = tokenizer.tokenize_text("今日は良い天気です。", partial_ok=False)
         assert len(tokens) > 0
 
 
+@pytest.fixture
+def problem_path(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    """Build a problematic input path of the kind named by request.param.
+
+    Used with indirect parameterization so each error test describes its
+    scenario by name instead of repeating the file-construction boilerplate.
+    """
+    kind = request.param
+    if kind == "missing":
+        return tmp_path / "nonexistent_file.txt"
+    if kind == "directory":
+        return tmp_path
+    path = tmp_path / "sample.txt"
+    if kind == "empty":
+        path.touch()
+    elif kind == "whitespace":
+        path.write_text("   \n\t  \n  ", encoding="utf-8")
+    elif kind == "binary":
+        path.write_bytes(BINARY_BYTES)
+    elif kind == "high-non-text":
+        path.write_bytes(bytes(i % 256 for i in range(1000)))
+    elif kind == "no-japanese":
+        path.write_text("This is English text only.", encoding="utf-8")
+    return path
+
+
 class TestFileProcessing:
     """Tests for file processing functionality."""
 
-    def test_tokenize_file_with_path_object(self) -> None:
+    def test_tokenize_file_with_path_object(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test tokenizing a file using Path object."""
         # Create a temporary file with Japanese text
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("今日は良い天気です。")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_bytes(SAMPLE_JP_BYTES)
 
-        try:
-            tokenizer = JapaneseTokenizer()
-            tokens = tokenizer.tokenize_file(temp_path)
+        tokens = tokenizer.tokenize_file(temp_path)
 
-            assert len(tokens) > 0
-            assert all(isinstance(token, Token) for token in tokens)
-        finally:
-            temp_path.unlink()
+        assert len(tokens) > 0
+        assert all(isinstance(token, Token) for token in tokens)
 
-    def test_tokenize_file_with_string_path(self) -> None:
+    def test_tokenize_file_with_string_path(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test tokenizing a file using string path."""
-        # Create a temporary file with Japanese text
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("私はコーヒーを飲みます。")
-            temp_path = f.name
-
-        try:
-            tokenizer = JapaneseTokenizer()
-            tokens = tokenizer.tokenize_file(temp_path)
-
-            assert len(tokens) > 0
-            surfaces = [t.surface for t in tokens]
-            assert "私" in surfaces
-        finally:
-            Path(temp_path).unlink()
-
-    def test_tokenize_file_not_found(self) -> None:
-        """Test error handling for non-existent file."""
-        tokenizer = JapaneseTokenizer()
-
-        with pytest.raises(FileProcessingError) as exc_info:
-            tokenizer.tokenize_file("nonexistent_file.txt")
-
-        assert "File not found" in str(exc_info.value)
-        assert "nonexistent_file.txt" in str(exc_info.value)
-
-    def test_tokenize_file_is_directory(self) -> None:
-        """Test error handling when path is a directory."""
-        tokenizer = JapaneseTokenizer()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with pytest.raises(FileProcessingError) as exc_info:
-                tokenizer.tokenize_file(temp_dir)
-
-            assert "not a file" in str(exc_info.value).lower()
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_text("私はコーヒーを飲みます。", encoding="utf-8")
 
-    def test_tokenize_file_empty(self) -> None:
-        """Test error handling for empty file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            # Write nothing
-            temp_path = Path(f.name)
+        tokens = tokenizer.tokenize_file(str(temp_path))
 
-        try:
-            tokenizer = JapaneseTokenizer()
-
-            with pytest.raises(FileProcessingError) as exc_info:
-                tokenizer.tokenize_file(temp_path)
-
-            assert "empty" in str(exc_info.value).lower()
-        finally:
-            temp_path.unlink()
-
-    def test_tokenize_file_whitespace_only(self) -> None:
-        """Test error handling for file with only whitespace."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("   \n\t  \n  ")
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer()
-
-            with pytest.raises(FileProcessingError) as exc_info:
-                tokenizer.tokenize_file(temp_path)
-
-            assert "empty" in str(exc_info.value).lower()
-        finally:
-            temp_path.unlink()
+        assert len(tokens) > 0
+        surfaces = [t.surface for t in tokens]
+        assert "私" in surfaces
 
-    def test_tokenize_file_invalid_encoding(self) -> None:
+    def test_tokenize_file_iter_matches_tokenize_file(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test that lazy file iteration yields the same tokens as the list API."""
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_text("今日は良い天気です。\n私はコーヒーを飲みます。", encoding="utf-8")
+
+        streamed = list(tokenizer.tokenize_file_iter(temp_path))
+
+        assert streamed == tokenizer.tokenize_file(temp_path)
+        assert len(streamed) > 0
+
+    @pytest.mark.parametrize(
+        ("problem_path", "expected_error", "match"),
+        [
+            pytest.param(
+                "missing",
+                FileProcessingError,
+                r"(?s)File not found.*nonexistent_file\.txt",
+                id="missing",
+            ),
+            pytest.param(
+                "directory", FileProcessingError, r"(?i)not a file", id="directory"
+            ),
+            pytest.param("empty", FileProcessingError, r"(?i)empty", id="empty"),
+            pytest.param(
+                "whitespace", FileProcessingError, r"(?i)empty", id="whitespace"
+            ),
+            pytest.param(
+                "binary",
+                FileProcessingError,
+                r"(?is)binary.*text file",
+                id="binary",
+            ),
+            pytest.param(
+                "high-non-text",
+                FileProcessingError,
+                r"(?i)binary|text file",
+                id="high-non-text",
+            ),
+            pytest.param(
+                "no-japanese",
+                TokenizationError,
+                r"(?s)No Japanese text detected.*require_japanese=False",
+                id="no-japanese",
+            ),
+        ],
+        indirect=["problem_path"],
+    )
+    def test_tokenize_file_error_cases(
+        self,
+        problem_path: Path,
+        expected_error: type[Exception],
+        match: str,
+        tokenizer: JapaneseTokenizer,
+    ) -> None:
+        """Test error handling for each kind of problematic input path."""
+        with pytest.raises(expected_error, match=match):
+            tokenizer.tokenize_file(problem_path)
+
+    def test_tokenize_file_invalid_encoding(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test error handling for non-UTF-8 encoded file."""
         # Create a file with non-UTF-8 encoding
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="shift_jis", suffix=".txt", delete=False
-        ) as f:
-            f.write("今日は良い天気です。")
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer()
-
-            with pytest.raises(FileProcessingError) as exc_info:
-                tokenizer.tokenize_file(temp_path)
-
-            error_msg = str(exc_info.value).lower()
-            assert "encoding" in error_msg or "utf-8" in error_msg
-        finally:
-            temp_path.unlink()
-
-    def test_tokenize_file_multiline_text(self) -> None:
-        """Test tokenizing a file with multiple lines."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("今日は良い天気です。\n私はコーヒーを飲みます。\n元気ですか？")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_bytes(SHIFT_JIS_BYTES)
+
+        with pytest.raises(FileProcessingError, match=r"(?i)encoding|utf-8"):
+            tokenizer.tokenize_file(temp_path)
+
+    @pytest.mark.parametrize(
+        "contents,must_contain",
+        [
+            pytest.param(
+                "今日は良い天気です。\n私はコーヒーを飲みます。\n元気ですか？",
+                {"今日", "私", "元気"},
+                id="multiline",
+            ),
+            pytest.param(
+                "Hello 世界\n今日は良い天気です。\nGoodbye さようなら",
+                {"世界", "今日"},
+                id="mixed-content",
+            ),
+        ],
+    )
+    def test_tokenize_file_multiline_text(
+        self,
+        tmp_path: Path,
+        lenient_tokenizer: JapaneseTokenizer,
+        contents: str,
+        must_contain: set[str],
+    ) -> None:
+        """Test tokenizing multi-line files, including mixed-language content."""
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_text(contents, encoding="utf-8")
+
+        tokens = lenient_tokenizer.tokenize_file(temp_path)
 
-        try:
-            tokenizer = JapaneseTokenizer()
-            tokens = tokenizer.tokenize_file(temp_path)
+        assert len(tokens) > 0
+        # Every line should contribute tokens
+        surfaces = {t.surface for t in tokens}
+        assert must_contain <= surfaces
 
-            assert len(tokens) > 0
-            # Should have tokens from all lines
-            surfaces = [t.surface for t in tokens]
-            assert "今日" in surfaces
-            assert "私" in surfaces
-            assert "元気" in surfaces
-        finally:
-            temp_path.unlink()
-
-    def test_tokenize_real_file(self) -> None:
+    @requires_sample_file
+    def test_tokenize_real_file(self, tokenizer: JapaneseTokenizer) -> None:
         """Test tokenizing the sample Japanese text file."""
-        sample_file = Path("resources/お隣遊び - ぺんたごん.txt")
-
-        if sample_file.exists():
-            tokenizer = JapaneseTokenizer()
-            tokens = tokenizer.tokenize_file(sample_file)
-
-            assert len(tokens) > 0
-            assert all(isinstance(token, Token) for token in tokens)
-
-            # Verify we get meaningful tokens
-            surfaces = [t.surface for t in tokens]
-            assert len(surfaces) > 10  # Should have many tokens
-
-    def test_tokenize_binary_file_raises_error(self) -> None:
-        """Test that binary files are detected and rejected."""
-        # Create a binary file with null bytes
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-            f.write(b"\x00\x01\x02\x03\x04\x05")
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer()
-
-            with pytest.raises(FileProcessingError) as exc_info:
-                tokenizer.tokenize_file(temp_path)
-
-            error_msg = str(exc_info.value)
-            assert "binary" in error_msg.lower()
-            assert "text file" in error_msg.lower()
-        finally:
-            temp_path.unlink()
-
-    def test_tokenize_file_with_no_japanese_raises_error(self) -> None:
-        """Test that files with no Japanese text raise appropriate error."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("This is English text only.")
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer(require_japanese=True)
+        tokens = tokenizer.tokenize_file(SAMPLE_FILE)
 
-            with pytest.raises(TokenizationError) as exc_info:
-                tokenizer.tokenize_file(temp_path)
+        assert len(tokens) > 0
+        assert all(isinstance(token, Token) for token in tokens)
 
-            error_msg = str(exc_info.value)
-            assert "No Japanese text detected" in error_msg
-            assert "require_japanese=False" in error_msg
-        finally:
-            temp_path.unlink()
+        # Verify we get meaningful tokens
+        assert len(tokens) > 10  # Should have many tokens
 
-    def test_tokenize_file_error_includes_suggestions(self) -> None:
+    def test_tokenize_file_error_includes_suggestions(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that file errors include helpful suggestions."""
-        tokenizer = JapaneseTokenizer()
 
-        with pytest.raises(FileProcessingError) as exc_info:
+        with pytest.raises(FileProcessingError, match=r"(?is)Suggestions?:.*file path"):
             tokenizer.tokenize_file("nonexistent_file.txt")
 
-        error_msg = str(exc_info.value)
-        assert "Suggestions:" in error_msg or "Suggestion:" in error_msg
-        assert "file path" in error_msg.lower()
-
-    def test_tokenize_file_encoding_error_includes_suggestions(self) -> None:
+    def test_tokenize_file_encoding_error_includes_suggestions(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that encoding errors include conversion suggestions."""
         # Create a file with non-UTF-8 encoding
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="shift_jis", suffix=".txt", delete=False
-        ) as f:
-            f.write("今日は良い天気です。")
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer()
-
-            with pytest.raises(FileProcessingError) as exc_info:
-                tokenizer.tokenize_file(temp_path)
-
-            error_msg = str(exc_info.value)
-            assert "encoding" in error_msg.lower()
-            assert "UTF-8" in error_msg
-            # Should include conversion suggestions
-            assert "iconv" in error_msg or "convert" in error_msg.lower()
-        finally:
-            temp_path.unlink()
-
-    def test_tokenize_file_with_mixed_content(self) -> None:
-        """Test tokenizing file with mixed Japanese and English content."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("Hello 世界\n今日は良い天気です。\nGoodbye さようなら")
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer(require_japanese=False)
-            tokens = tokenizer.tokenize_file(temp_path)
-            assert len(tokens) > 0
-            # Should have tokens from Japanese portions
-            surfaces = [t.surface for t in tokens]
-            assert "世界" in surfaces or "今日" in surfaces
-        finally:
-            temp_path.unlink()
-
-    def test_tokenize_file_unexpected_error(self) -> None:
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_bytes(SHIFT_JIS_BYTES)
+
+        # Message should name the encoding problem and suggest conversion
+        with pytest.raises(
+            FileProcessingError,
+            match=r"(?is)encoding.*UTF-8.*(?:iconv|convert)",
+        ):
+            tokenizer.tokenize_file(temp_path)
+
+    def test_tokenize_file_unexpected_error(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test handling of unexpected errors during file processing."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("今日は良い天気です。")
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer()
-            # Normal processing should work
-            tokens = tokenizer.tokenize_file(temp_path)
-            assert len(tokens) > 0
-        finally:
-            temp_path.unlink()
-
-    def test_tokenize_file_with_high_non_text_ratio(self) -> None:
-        """Test binary detection with high non-text character ratio."""
-        # Create a file with many non-printable characters
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".dat", delete=False) as f:
-            # Mix of binary and some text
-            content = bytes([i % 256 for i in range(1000)])
-            f.write(content)
-            temp_path = Path(f.name)
-
-        try:
-            tokenizer = JapaneseTokenizer()
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_bytes(SAMPLE_JP_BYTES)
 
-            with pytest.raises(FileProcessingError) as exc_info:
-                tokenizer.tokenize_file(temp_path)
-
-            error_msg = str(exc_info.value)
-            assert "binary" in error_msg.lower() or "text file" in error_msg.lower()
-        finally:
-            temp_path.unlink()
+        # Normal processing should work
+        tokens = tokenizer.tokenize_file(temp_path)
+        assert len(tokens) > 0
 
-    def test_tokenize_file_with_mostly_text_content(self) -> None:
+    def test_tokenize_file_with_mostly_text_content(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that files with mostly text content are not flagged as binary."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            # Write mostly text with some special characters
-            f.write("今日は良い天気です。\n" * 10)
-            temp_path = Path(f.name)
+        # Write mostly text with some special characters
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_text("今日は良い天気です。\n" * 10, encoding="utf-8")
 
-        try:
-            tokenizer = JapaneseTokenizer()
-            # Should successfully process as text
-            tokens = tokenizer.tokenize_file(temp_path)
-            assert len(tokens) > 0
-        finally:
-            temp_path.unlink()
+        # Should successfully process as text
+        tokens = tokenizer.tokenize_file(temp_path)
+        assert len(tokens) > 0
 
 
 class TestTokenizerInitialization:
     """Tests for tokenizer initialization and error handling."""
 
-    def test_tokenizer_initialization_with_invalid_dictionary(self) -> None:
+    def test_tokenizer_initialization_with_invalid_dictionary(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that invalid dictionary type raises appropriate error."""
         # This test verifies the error handling for missing dictionaries
         # In practice, this would require uninstalling the dictionary
         # For now, we test with a valid dictionary to ensure initialization works
-        tokenizer = JapaneseTokenizer(dictionary_type="full")
         assert tokenizer.dictionary_type == "full"
 
-    def test_tokenizer_initialization_error_handling(self) -> None:
+    def test_tokenizer_initialization_error_handling(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test that tokenizer initialization errors are handled properly."""
         # Test that tokenizer is properly initialized
-        tokenizer = JapaneseTokenizer()
         assert tokenizer._tokenizer is not None
 
     def test_tokenize_with_uninitialized_tokenizer(self) -> None:
@@ -630,11 +714,9 @@ class TestTokenizerInitialization:
         # Manually set tokenizer to None to simulate initialization failure
         tokenizer._tokenizer = None
 
-        with pytest.raises(TokenizationError) as exc_info:
+        with pytest.raises(TokenizationError, match=r"(?i)not initialized"):
             tokenizer.tokenize_text("今日は")
 
-        assert "not initialized" in str(exc_info.value).lower()
-
     def test_tokenizer_with_missing_core_dictionary(self) -> None:
         """Test that missing core dictionary raises appropriate error."""
         # This test verifies error handling when dictionary is not installed
@@ -666,122 +748,172 @@ class TestTokenizerInitialization:
             assert "install" in error_msg.lower()
 
 
-class TestPerformance:
-    """Tests for performance with large files and text."""
+class TestChunking:
+    """Tests for the internal chunk iterators and the chunked tokenize path.
 
-    def test_tokenize_large_text(self) -> None:
-        """Test tokenizing large text performs reasonably."""
-        tokenizer = JapaneseTokenizer()
+    Default-run inputs stay below the chunk threshold, so the chunked path
+    and its position rebasing need their own coverage here; these tests are
+    fast and run on every pytest invocation.
+    """
 
-        # Create a large text by repeating a sentence
-        sentence = "今日は良い天気ですね。私はコーヒーを飲みます。"
-        large_text = sentence * 100  # 100 repetitions
+    def test_line_chunks_cover_text_with_correct_offsets(self) -> None:
+        """Test that line chunks reassemble the text and offsets index into it."""
+        text = "短い行です。\n" * 20
 
-        tokens = tokenizer.tokenize_text(large_text)
+        chunks = list(_iter_line_chunks(text, max_chars=30))
 
-        # Should successfully tokenize all text
-        assert len(tokens) > 0
-        # Rough estimate: each sentence has ~14 tokens, so 100 * 14 = 1400
-        assert len(tokens) > 1000
-
-    def test_tokenize_large_file(self) -> None:
-        """Test tokenizing a large file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            # Write a large amount of text
-            sentence = "今日は良い天気ですね。私はコーヒーを飲みます。\n"
-            for _ in range(100):
-                f.write(sentence)
-            temp_path = Path(f.name)
+        assert len(chunks) > 1
+        assert "".join(chunk for _, chunk in chunks) == text
+        for offset, chunk in chunks:
+            assert text[offset : offset + len(chunk)] == chunk
 
-        try:
-            tokenizer = JapaneseTokenizer()
-            tokens = tokenizer.tokenize_file(temp_path)
+    def test_line_chunks_split_at_line_boundaries(self) -> None:
+        """Test that chunks end at line breaks when lines fit max_chars."""
+        text = "一行目です。\n二行目です。\n三行目です。\n"
 
-            # Should successfully process the entire file
-            assert len(tokens) > 1000
-            # Verify tokens have proper structure
-            assert all(isinstance(token, Token) for token in tokens)
-        finally:
-            temp_path.unlink()
+        chunks = list(_iter_line_chunks(text, max_chars=8))
 
-    def test_tokenize_real_large_file_if_exists(self) -> None:
-        """Test tokenizing the real sample file if it exists."""
-        sample_file = Path("resources/お隣遊び - ぺんたごん.txt")
+        assert all(chunk.endswith("\n") for _, chunk in chunks)
 
-        if sample_file.exists():
-            tokenizer = JapaneseTokenizer()
-            tokens = tokenizer.tokenize_file(sample_file)
+    def test_sentence_chunks_split_oversized_line(self) -> None:
+        """Test that an unbroken line splits at sentence enders with offsets
+        rebased onto the original text."""
+        line = "今日は晴れ。明日は雨。明後日は曇り。"
+        start = 5
 
-            # Should have many tokens
-            assert len(tokens) > 100
-            # All tokens should be valid
-            assert all(isinstance(token, Token) for token in tokens)
-            # All tokens should have required attributes
-            for token in tokens:
-                assert token.surface
-                assert token.reading
-                assert token.part_of_speech
-                assert token.dictionary_form
+        chunks = list(_iter_sentence_chunks(line, start=start, max_chars=6))
 
+        assert len(chunks) > 1
+        assert "".join(chunk for _, chunk in chunks) == line
+        assert all(chunk.endswith("。") for _, chunk in chunks)
+        for offset, chunk in chunks:
+            local = offset - start
+            assert line[local : local + len(chunk)] == chunk
 
-class TestTokenizationModes:
-    """Tests for tokenization mode configuration and behavior."""
+    def test_sentence_chunks_keep_oversized_sentence_whole(self) -> None:
+        """Test that a single sentence above max_chars is emitted unsplit."""
+        line = "とてもとてもとても長い一文です。"
 
-    def test_mode_short_produces_most_tokens(self) -> None:
-        """Test that SHORT mode produces the most tokens (finest granularity)."""
-        text = "国立国会図書館で調べ物をしました。"
+        chunks = list(_iter_sentence_chunks(line, start=0, max_chars=4))
 
-        tokenizer_short = JapaneseTokenizer(mode=TokenizationMode.SHORT)
-        tokens_short = tokenizer_short.tokenize_text(text)
+        assert chunks == [(0, line)]
 
-        # SHORT mode should split compound words most aggressively
-        surfaces = [t.surface for t in tokens_short]
+    def test_tokenize_very_large_text_uses_chunking(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test that texts above the chunk threshold tokenize correctly."""
 
-        # Verify exact token count and surfaces
-        assert len(tokens_short) == 11
-        assert surfaces == ["国立", "国会", "図書", "館", "で", "調べ物", "を", "し", "まし", "た", "。"]
+        sentence = "今日は良い天気ですね。私はコーヒーを飲みます。\n"
+        large_text = sentence * 500  # Well above the internal chunk size
 
-    def test_mode_long_produces_fewest_tokens(self) -> None:
-        """Test that LONG mode produces the fewest tokens (coarsest granularity)."""
-        text = "国立国会図書館で調べ物をしました。"
+        tokens = tokenizer.tokenize_text(large_text)
 
-        tokenizer_long = JapaneseTokenizer(mode=TokenizationMode.LONG)
-        tokens_long = tokenizer_long.tokenize_text(text)
+        assert len(tokens) > 5000
+        # Positions must remain offsets into the original text, spanning
+        # beyond the first chunk
+        assert tokens[-1].position > len(sentence) * 400
+        positions = [t.position for t in tokens]
+        assert positions == sorted(positions)
 
-        # LONG mode should keep compound words together
-        surfaces = [t.surface for t in tokens_long]
 
-        # Verify exact token count and surfaces
-        assert len(tokens_long) == 9
-        assert surfaces == ["国立", "国会図書館", "で", "調べ物", "を", "し", "まし", "た", "。"]
+@pytest.mark.slow
+class TestPerformance:
+    """Tests for performance with large files and text.
+
+    These are scale smoke tests, not behavior tests; they dominate suite
+    wall time and are skipped unless --runslow is given.
+    """
+
+    def test_tokenize_large_text_and_file(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test tokenizing large input both as text and from a file."""
+        # Build the large input once and exercise both entry points with it
+        sentence = "今日は良い天気ですね。私はコーヒーを飲みます。\n"
+        large_text = sentence * 100  # 100 repetitions
 
-    def test_mode_medium_is_balanced(self) -> None:
-        """Test that MEDIUM mode produces balanced tokenization."""
-        text = "国立国会図書館で調べ物をしました。"
+        text_tokens = tokenizer.tokenize_text(large_text)
 
-        tokenizer_medium = JapaneseTokenizer(mode=TokenizationMode.MEDIUM)
-        tokens_medium = tokenizer_medium.tokenize_text(text)
+        # Rough estimate: each sentence has ~14 tokens, so 100 * 14 = 1400
+        assert len(text_tokens) > 1000
 
-        # MEDIUM mode should be between SHORT and LONG
-        surfaces = [t.surface for t in tokens_medium]
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_text(large_text, encoding="utf-8")
 
-        # Verify exact token count and surfaces
-        assert len(tokens_medium) == 10
-        assert surfaces == ["国立", "国会", "図書館", "で", "調べ物", "を", "し", "まし", "た", "。"]
+        file_tokens = tokenizer.tokenize_file(temp_path)
 
-    def test_different_modes_produce_different_granularities(self) -> None:
-        """Test that different modes produce different token counts for the same text."""
-        text = "国立国会図書館で調べ物をしました。"
+        # The file path should process the same content completely
+        assert len(file_tokens) > 1000
+        assert all(isinstance(token, Token) for token in file_tokens)
 
-        tokenizer_short = JapaneseTokenizer(mode=TokenizationMode.SHORT)
-        tokenizer_medium = JapaneseTokenizer(mode=TokenizationMode.MEDIUM)
-        tokenizer_long = JapaneseTokenizer(mode=TokenizationMode.LONG)
+    @requires_sample_file
+    def test_tokenize_real_large_file_if_exists(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
+        """Test tokenizing the real sample file if it exists."""
+        tokens = tokenizer.tokenize_file(SAMPLE_FILE)
 
-        tokens_short = tokenizer_short.tokenize_text(text)
-        tokens_medium = tokenizer_medium.tokenize_text(text)
-        tokens_long = tokenizer_long.tokenize_text(text)
+        # Should have many tokens
+        assert len(tokens) > 100
+        # All tokens should be valid
+        assert all(isinstance(token, Token) for token in tokens)
+        # All tokens should have required attributes
+        for token in tokens:
+            assert token.surface
+            assert token.reading
+            assert token.part_of_speech
+            assert token.dictionary_form
+
+
+class TestTokenizationModes:
+    """Tests for tokenization mode configuration and behavior."""
+
+    # The same compound-heavy sentence exercises every granularity.
+    MODE_TEXT = "国立国会図書館で調べ物をしました。"
+
+    # One (session fixture, exact segmentation) case per mode; the expected
+    # token counts (11/10/9) are implied by the surface lists.
+    MODE_CASES = [
+        pytest.param(
+            "short_tokenizer",
+            ["国立", "国会", "図書", "館", "で", "調べ物", "を", "し", "まし", "た", "。"],
+            id="short",
+        ),
+        pytest.param(
+            "tokenizer",
+            ["国立", "国会", "図書館", "で", "調べ物", "を", "し", "まし", "た", "。"],
+            id="medium",
+        ),
+        pytest.param(
+            "long_tokenizer",
+            ["国立", "国会図書館", "で", "調べ物", "を", "し", "まし", "た", "。"],
+            id="long",
+        ),
+    ]
+
+    @pytest.mark.parametrize(("fixture_name", "expected_surfaces"), MODE_CASES)
+    def test_mode_granularity(
+        self,
+        request: pytest.FixtureRequest,
+        fixture_name: str,
+        expected_surfaces: list[str],
+    ) -> None:
+        """Test exact segmentation per mode for the same text."""
+        mode_tokenizer = request.getfixturevalue(fixture_name)
+        tokens = mode_tokenizer.tokenize_text(self.MODE_TEXT)
+
+        assert [t.surface for t in tokens] == expected_surfaces
+
+    def test_different_modes_produce_different_granularities(
+        self,
+        tokenizer: JapaneseTokenizer,
+        short_tokenizer: JapaneseTokenizer,
+        long_tokenizer: JapaneseTokenizer,
+    ) -> None:
+        """Test that different modes produce different token counts for the same text."""
+        tokens_short = short_tokenizer.tokenize_text(self.MODE_TEXT)
+        tokens_medium = tokenizer.tokenize_text(self.MODE_TEXT)
+        tokens_long = long_tokenizer.tokenize_text(self.MODE_TEXT)
 
         # Verify all three modes produce different token counts
         assert len(tokens_short) == 11  # Most tokens (finest granularity)
@@ -854,53 +986,45 @@ class TestTokenizationModes:
         assert TokenizationMode.MEDIUM.value == "B"
         assert TokenizationMode.LONG.value == "C"
 
-    def test_default_mode_is_medium(self) -> None:
+    def test_default_mode_is_medium(self, tokenizer: JapaneseTokenizer) -> None:
         """Test that default tokenization mode is MEDIUM."""
-        tokenizer = JapaneseTokenizer()
         assert tokenizer.mode == TokenizationMode.MEDIUM
 
 
 class TestIntegration:
     """Integration tests for complete tokenization workflows."""
 
-    def test_end_to_end_file_to_vocabulary(self) -> None:
+    def test_end_to_end_file_to_vocabulary(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test complete workflow from file to vocabulary extraction."""
         # Create a test file with various Japanese text
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".txt", delete=False
-        ) as f:
-            f.write("私は毎日日本語を勉強します。\n")
-            f.write("昨日、美味しいラーメンを食べました。\n")
-            f.write("明日も頑張ります！\n")
-            temp_path = Path(f.name)
-
-        try:
-            # Initialize tokenizer
-            tokenizer = JapaneseTokenizer(mode=TokenizationMode.MEDIUM)
-
-            # Tokenize file
-            tokens = tokenizer.tokenize_file(temp_path)
+        temp_path = tmp_path / "sample.txt"
+        temp_path.write_text(
+            "私は毎日日本語を勉強します。\n" "昨日、美味しいラーメンを食べました。\n" "明日も頑張ります！\n",
+            encoding="utf-8",
+        )
 
-            # Extract vocabulary (unique dictionary forms)
-            vocabulary = {token.dictionary_form for token in tokens}
+        # Tokenize file
+        tokens = tokenizer.tokenize_file(temp_path)
 
-            # Verify we got meaningful vocabulary
-            assert len(vocabulary) > 10
-            assert "勉強" in vocabulary or "勉強する" in vocabulary
-            assert "食べる" in vocabulary
-            assert "頑張る" in vocabulary
+        # Extract vocabulary (unique dictionary forms)
+        vocabulary = {token.dictionary_form for token in tokens}
 
-            # Verify all tokens have complete metadata
-            for token in tokens:
-                assert token.surface
-                assert token.reading
-                assert token.part_of_speech
-                assert token.dictionary_form
-                assert isinstance(token.position, int)
-                assert token.features
+        # Verify we got meaningful vocabulary
+        assert len(vocabulary) > 10
+        assert "勉強" in vocabulary or "勉強する" in vocabulary
+        assert "食べる" in vocabulary
+        assert "頑張る" in vocabulary
 
-        finally:
-            temp_path.unlink()
+        # Verify all tokens have complete metadata
+        for token in tokens:
+            assert token.surface
+            assert token.reading
+            assert token.part_of_speech
+            assert token.dictionary_form
+            assert isinstance(token.position, int)
+            assert token.features
 
     def test_end_to_end_with_different_modes(self) -> None:
         """Test that different modes produce different but valid results."""
@@ -926,18 +1050,18 @@ class TestIntegration:
             results[TokenizationMode.LONG]
         )
 
-    def test_vocabulary_extraction_with_filtering(self) -> None:
+    def test_vocabulary_extraction_with_filtering(
+        self, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test extracting vocabulary while filtering particles."""
-        tokenizer = JapaneseTokenizer()
         text = "私は日本語を勉強します。"
         tokens = tokenizer.tokenize_text(text)
 
-        # Extract only content words (exclude particles)
-        particles = {"助詞", "助動詞"}
+        # Extract only content words (exclude particles and auxiliaries)
         content_words = [
             token.dictionary_form
             for token in tokens
-            if token.part_of_speech not in particles
+            if token.part_of_speech not in FUNCTION_WORD_POS
         ]
 
         # Should have content words but not particles
@@ -946,9 +1070,8 @@ class TestIntegration:
         assert "日本語" in content_words
         assert "勉強" in content_words or "勉強する" in content_words
 
-    def test_reading_extraction_for_anki(self) -> None:
+    def test_reading_extraction_for_anki(self, tokenizer: JapaneseTokenizer) -> None:
         """Test extracting readings suitable for Anki cards."""
-        tokenizer = JapaneseTokenizer()
         text = "私は日本語を勉強します。"
         tokens = tokenizer.tokenize_text(text)
 
@@ -956,7 +1079,7 @@ class TestIntegration:
         anki_pairs = [
             (token.surface, token.reading)
             for token in tokens
-            if token.part_of_speech not in {"助詞", "助動詞", "記号"}
+            if token.part_of_speech not in NON_CONTENT_POS
         ]
 
         # Should have meaningful pairs
@@ -967,40 +1090,35 @@ class TestIntegration:
             assert reading  # Not empty
             assert isinstance(reading, str)
 
-    def test_multiple_files_processing(self) -> None:
+    def test_multiple_files_processing(
+        self, tmp_path: Path, tokenizer: JapaneseTokenizer
+    ) -> None:
         """Test processing multiple files in sequence."""
+        # Create multiple test files
         files = []
-        try:
-            # Create multiple test files
-            for i in range(3):
-                with tempfile.NamedTemporaryFile(
-                    mode="w", encoding="utf-8", suffix=".txt", delete=False
-                ) as f:
-                    f.write(f"これはファイル{i + 1}です。\n")
-                    f.write("日本語のテキストです。\n")
-                    files.append(Path(f.name))
-
-            # Process all files with same tokenizer
-            tokenizer = JapaneseTokenizer()
-            all_tokens = []
-
-            for file_path in files:
-                tokens = tokenizer.tokenize_file(file_path)
-                all_tokens.extend(tokens)
-
-            # Should have tokens from all files
-            assert len(all_tokens) > 20  # At least some tokens from each file
-
-            # Verify all tokens are valid
-            assert all(isinstance(token, Token) for token in all_tokens)
-
-        finally:
-            for file_path in files:
-                file_path.unlink()
-
-    def test_error_recovery_workflow(self) -> None:
+        for i in range(3):
+            file_path = tmp_path / f"sample{i}.txt"
+            file_path.write_text(
+                f"これはファイル{i + 1}です。\n日本語のテキストです。\n",
+                encoding="utf-8",
+            )
+            files.append(file_path)
+
+        # Process all files with same tokenizer
+        all_tokens = []
+
+        for file_path in files:
+            tokens = tokenizer.tokenize_file(file_path)
+            all_tokens.extend(tokens)
+
+        # Should have tokens from all files
+        assert len(all_tokens) > 20  # At least some tokens from each file
+
+        # Verify all tokens are valid
+        assert all(isinstance(token, Token) for token in all_tokens)
+
+    def test_error_recovery_workflow(self, tokenizer: JapaneseTokenizer) -> None:
         """Test that errors provide actionable information for recovery."""
-        tokenizer = JapaneseTokenizer()
 
         # Test 1: Non-existent file
         try: